@@ -121,4 +121,11 @@ def excel_converter():
 # =============================================================================
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=8000, debug=True)
+    # Only an explicit FLASK_DEBUG=1/true turns on the reloader and debugger
+    if os.environ.get('FLASK_DEBUG', '').lower() in ('1', 'true'):
+        # Development: Werkzeug reloader + debugger
+        app.run(host='0.0.0.0', port=8000, debug=True)
+    else:
+        # Production: multi-threaded WSGI server
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=8000, threads=8)
@@ -6,6 +6,11 @@ Contains all JSON configuration files.
 import os
 import json
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
 # Get the directory where this file is located
 CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -13,6 +18,9 @@ CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
 def load_json(filename):
     """Load a JSON file from the config directory."""
     filepath = os.path.join(CONFIG_DIR, filename)
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
     with open(filepath, 'r') as f:
         return json.load(f)
 
@@ -20,6 +28,10 @@ def load_json(filename):
 def save_json(filename, data):
     """Save data to a JSON file in the config directory."""
     filepath = os.path.join(CONFIG_DIR, filename)
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
     with open(filepath, 'w') as f:
         json.dump(data, f, indent=2)
 
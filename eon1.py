@@ -1,12 +1,47 @@
+import functools
 import json
+import mmap
 import re
+import sys
+from collections import deque
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+# ==========================================================
+# FEATURE KEYS
+# ==========================================================
+# Interned once so every product dict shares the same key objects and
+# lookups can short-circuit on identity instead of comparing strings.
+_FEATURE_KEYS = tuple(sys.intern(k) for k in (
+    "Capacity", "Floor", "Duty Cycle", "Speed", "Speed Min", "Speed Max",
+    "Power", "Customization", "Benefit", "All Capacities", "Max Capacity",
+    "All Floors", "Max Floor",
+))
+_NUM_KEYS = {k: sys.intern(k + "_num") for k in _FEATURE_KEYS}
+
+
+def get_numeric_key(feature):
+    numeric_key = _NUM_KEYS.get(feature)
+    if numeric_key is None:
+        numeric_key = _NUM_KEYS[feature] = sys.intern(feature + "_num")
+    return numeric_key
+
 
 # ==========================================================
 # LOAD DATA
 # ==========================================================
 def load_products(filename="products.json"):
-    with open(filename, "r") as f:
-        raw_data = json.load(f)
+    if orjson is not None:
+        # Feed the mapped file straight to orjson without an extra copy
+        with open(filename, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as buf:
+                raw_data = orjson.loads(buf)
+    else:
+        with open(filename, "r") as f:
+            raw_data = json.load(f)
     
     products = []
     
@@ -71,8 +106,9 @@ def load_products(filename="products.json"):
             "Speed Min": speed_min_value,
             "Speed Max": speed_max_value,
             "Power": product.get("Tech Spec Power Max"),
-            "Customization": ", ".join(filter(None, customizations)) if customizations else None,
-            "Benefit": ", ".join(filter(None, benefits)) if benefits else None,
+            # Both lists only ever receive truthy values, so join them directly
+            "Customization": ", ".join(customizations) if customizations else None,
+            "Benefit": ", ".join(benefits) if benefits else None,
             # Add ALL capacity values for comprehensive checking
             "All Capacities": capacities,
             "Max Capacity": max(capacities) if capacities else None,
@@ -88,34 +124,93 @@ def load_products(filename="products.json"):
                 # Extract numeric value
                 num = extract_number_from_value(value)
                 if num is not None:
-                    new_product[feature_name + "_num"] = num
+                    new_product[get_numeric_key(feature_name)] = num
         
-        # Also add raw keys from JSON
-        for key, value in product.items():
-            if key == "Product Name":
-                continue
-            if key not in new_product:
-                new_product[key] = value
-                # Extract numeric value if present
-                num = extract_number_from_value(value)
-                if num is not None:
-                    new_product[key + "_num"] = num
+        # Keep the raw JSON row by reference; unmapped keys are read (and their
+        # numbers extracted) on demand through get_feature_value
+        new_product["_raw"] = product
         
         products.append(new_product)
     
+    index_products(products)
     return products
 
 
+# ==========================================================
+# CATALOG INDEX
+# ==========================================================
+# The catalog never changes after loading, so each numeric feature is sorted
+# once here and max/min/top queries just index into the precomputed rankings.
+_INDEXED_PRODUCTS = None
+_INDEX = None
+
+
+def build_index(products):
+    numeric_keys = {key for p in products for key in p if key.endswith("_num")}
+    
+    rankings = {}
+    for numeric_key in numeric_keys:
+        values = [p for p in products if numeric_key in p]
+        # Stable sorts keep catalog order for ties, same as max()/min()/sorted()
+        descending = sorted(values, key=lambda x: x[numeric_key], reverse=True)
+        ascending = sorted(values, key=lambda x: x[numeric_key])
+        rankings[numeric_key] = (descending, ascending)
+    
+    # Exact-name lookup keeping the first product for each full/short name
+    names = build_name_entries(products)
+    name_lookup = {}
+    for name, short, product in names:
+        name_lookup.setdefault(name, product)
+        name_lookup.setdefault(short, product)
+    
+    # Features the filters may use: indexed and present on the first product,
+    # which is what the per-query products[0] checks used to decide
+    available = frozenset(key for key in products[0] if key in rankings) if products else frozenset()
+    
+    return {
+        "available": available,
+        "rankings": rankings,
+        "names": names,
+        "name_lookup": name_lookup,
+    }
+
+
+def build_name_entries(products):
+    # (full name, short name without "eon "), lowered, in catalog order
+    entries = []
+    for product in products:
+        name = product.get("Product Name", "").lower()
+        entries.append((name, name.replace("eon ", ""), product))
+    return entries
+
+
+def index_products(products):
+    global _INDEXED_PRODUCTS, _INDEX
+    _INDEX = build_index(products)
+    _INDEXED_PRODUCTS = products
+    _cached_answer.cache_clear()
+
+
+def get_index(products):
+    if products is _INDEXED_PRODUCTS:
+        return _INDEX
+    # Ad-hoc product lists are indexed on the fly and not cached
+    return build_index(products)
+
+
 # ==========================================================
 # EXTRACT NUMERIC FROM VALUE
 # ==========================================================
+_NUMBER_RE = re.compile(r"\d+\.?\d*")
+
+
 def extract_number_from_value(value):
     if value is None:
         return None
     
-    numbers = re.findall(r"\d+\.?\d*", str(value))
+    numbers = _NUMBER_RE.findall(str(value))
     if numbers:
-        return max(float(n) for n in numbers)
+        return max(map(float, numbers))
     
     return None
 
@@ -199,10 +294,12 @@ def detect_feature(question, products):
 def detect_product_name(question, products):
     q = question.lower()
     
-    for product in products:
-        product_name = product.get("Product Name", "").lower()
-        product_name_short = product_name.replace("eon ", "")
-        
+    if products is _INDEXED_PRODUCTS:
+        entries = _INDEX["names"]
+    else:
+        entries = build_name_entries(products)
+    
+    for product_name, product_name_short, product in entries:
         if product_name in q or product_name_short in q:
             return product["Product Name"]
     
@@ -213,7 +310,7 @@ def detect_product_name(question, products):
 # EXTRACT NUMBERS FROM QUESTION
 # ==========================================================
 def extract_numbers(question):
-    return [float(n) for n in re.findall(r"\d+\.?\d*", question)]
+    return list(map(float, _NUMBER_RE.findall(question)))
 
 
 # ==========================================================
@@ -222,10 +319,10 @@ def extract_numbers(question):
 def get_product_by_name(products, name):
     name_lower = name.lower()
     
-    for product in products:
-        product_name = product.get("Product Name", "").lower()
-        product_name_short = product_name.replace("eon ", "")
-        
+    if products is _INDEXED_PRODUCTS:
+        return _INDEX["name_lookup"].get(name_lower)
+    
+    for product_name, product_name_short, product in build_name_entries(products):
         if name_lower == product_name or name_lower == product_name_short:
             return product
     
@@ -238,7 +335,19 @@ def get_product_by_name(products, name):
 def get_feature_value(product, feature):
     if feature in product:
         return product[feature]
-    return None
+    
+    raw = product.get("_raw")
+    if raw is None:
+        return None
+    
+    # Numeric siblings of raw keys are extracted on first use and cached
+    if feature.endswith("_num") and feature[:-4] in raw:
+        num = extract_number_from_value(raw[feature[:-4]])
+        if num is not None:
+            product[feature] = num
+        return num
+    
+    return raw.get(feature)
 
 
 # ==========================================================
@@ -255,18 +364,25 @@ def apply_filter(products, feature, intent, question):
         return []
     
     # Find the numeric key
-    numeric_key = feature + "_num"
+    numeric_key = get_numeric_key(feature)
     
-    # Special case: use Max Capacity_num or Max Floor_num or Speed Min_num or Speed Max_num
-    if feature in ["Max Capacity", "Max Floor", "Speed Min", "Speed Max"]:
-        numeric_key = feature + "_num"
-    
-    if numeric_key not in products[0]:
+    index = get_index(products)
+    if numeric_key not in index["available"]:
         return []
     
-    values = [p for p in products if numeric_key in p]
+    numbers = extract_numbers(question)
     
-    numbers = [float(n) for n in re.findall(r"\d+\.?\d*", question)]
+    # max/min/top read straight from the precomputed ranking
+    if intent in ("max", "min", "top"):
+        descending, ascending = index["rankings"][numeric_key]
+        if intent == "max":
+            return descending[:1]
+        if intent == "min":
+            return ascending[:1]
+        n = int(numbers[0]) if numbers else 1
+        return descending[:n]
+    
+    values = [p for p in products if numeric_key in p]
     
     if intent == "between" and len(numbers) >= 2:
         low, high = numbers[0], numbers[1]
@@ -284,17 +400,6 @@ def apply_filter(products, feature, intent, question):
     if intent == "atmost" and numbers:
         return [p for p in values if p[numeric_key] <= numbers[0]]
     
-    if intent == "max":
-        return [max(values, key=lambda x: x[numeric_key])] if values else []
-    
-    if intent == "min":
-        return [min(values, key=lambda x: x[numeric_key])] if values else []
-    
-    if intent == "top":
-        n = int(numbers[0]) if numbers else 1
-        sorted_products = sorted(values, key=lambda x: x[numeric_key], reverse=True)
-        return sorted_products[:n]
-    
     return []
 
 
@@ -340,426 +445,394 @@ def get_unit_for_feature(feature, products):
 
 
 # ==========================================================
-# ANSWER ENGINE
+# KEYWORD SCAN
 # ==========================================================
-def answer_question(question, products):
-    q = question.lower()
+# Every phrase answer_question branches on. The question is scanned for all
+# of them once, and the branches below test membership in the hit set
+# instead of rescanning the question for each phrase.
+_QUESTION_KEYWORDS = (
+    "show details", "tell me about", "give me specs", "give me complete", "give me the",
+    "highest", "lowest", "highest number", "lowest number", "top",
+    " and ", "between", " between ",
+    "more than", "greater than", "above", "less than", "below", "under",
+    "at least", "at most", "minimum", "maximum",
+    "duty cycle", "duty", "speed", "m/s", "capacity", "kg", "floor", "power", "kw",
+)
+
+
+# Phrase classes the dispatcher tests as a group against the hit set
+_DETAIL_PHRASES = frozenset(("show details", "tell me about", "give me specs", "give me complete", "give me the"))
+_HIGH_LOW_PHRASES = frozenset(("highest", "lowest", "highest number", "lowest number"))
+_COMPARISON_PHRASES = frozenset(("more than", "less than", "at least", "at most", "above", "below", "under"))
+
+
+def scan_keywords(q):
+    return frozenset(kw for kw in _QUESTION_KEYWORDS if kw in q)
+
+
+# ==========================================================
+# AND-CONDITION PARSING
+# ==========================================================
+# Comparison phrases per intent, checked in order. Capacity and floor
+# questions also accept the wider wording ("under", "minimum", ...).
+_BASE_COMPARISONS = (
+    ("greater", frozenset(("more than", "above"))),
+    ("less", frozenset(("less than", "below"))),
+    ("atleast", frozenset(("at least",))),
+    ("atmost", frozenset(("at most",))),
+)
+_WIDE_COMPARISONS = (
+    ("greater", frozenset(("more than", "above", "greater than"))),
+    ("less", frozenset(("less than", "below", "under"))),
+    ("atleast", frozenset(("at least", "minimum"))),
+    ("atmost", frozenset(("at most", "maximum"))),
+)
+
+# (feature, trigger keywords, comparisons) - duty cycle is checked before
+# capacity so it claims its numbers first
+_CONDITION_SPECS = (
+    ("Duty Cycle", frozenset(("duty cycle", "duty")), _BASE_COMPARISONS),
+    ("Speed", frozenset(("speed", "m/s")), _BASE_COMPARISONS),
+    ("Capacity", frozenset(("capacity", "kg")), _WIDE_COMPARISONS),
+    ("Floor", frozenset(("floor",)), _WIDE_COMPARISONS),
+    ("Power", frozenset(("power", "kw")), _BASE_COMPARISONS),
+)
+
+
+def parse_condition(hits, feature, comparisons, nums, remaining):
+    # remaining holds the question's numbers not yet claimed by an earlier
+    # condition, in order; each condition pops what it uses from the left
+    if "between" in hits and len(nums) >= 2:
+        if len(remaining) >= 2:
+            return (feature, "between", remaining.popleft(), remaining.popleft())
+        return None
     
-    # Handle "Show details" / "Tell me about" / "Give me specs" type questions
-    if any(x in q for x in ["show details", "tell me about", "give me specs", "give me complete", "give me the"]):
-        product_name = detect_product_name(q, products)
-        if product_name:
-            product = get_product_by_name(products, product_name)
-            if product:
-                return format_product_details(product)
-        return "Product not found."
-    
-    # Handle specific product feature queries
-    product_name = detect_product_name(q, products)
-    feature = detect_feature(question, products)
+    if not nums:
+        return None
     
-    # If we have a specific product and a feature, get the specific value
-    if product_name and feature:
-        product = get_product_by_name(products, product_name)
-        if product:
-            value = get_feature_value(product, feature)
-            if value is not None:
-                unit = get_unit_for_feature(feature, products)
-                return f"{product['Product Name']} has {format_feature_name(feature)} of {value} {unit}.".strip()
+    for intent, phrases in comparisons:
+        if not phrases.isdisjoint(hits):
+            if remaining:
+                return (feature, intent, remaining.popleft())
+            return None
     
+    return None
+
+
+# ==========================================================
+# ANSWER HANDLERS
+# ==========================================================
+# Each handler gets the parsed question context and returns an answer, or
+# None when the question is not its kind. compute_answer tries them in order.
+def _format_single(product, feature, products):
+    value = get_feature_value(product, feature)
+    unit = get_unit_for_feature(feature, products)
+    return f"{product['Product Name']} has {format_feature_name(feature)} of {value} {unit}.".strip()
+
+
+def _format_matches(result):
+    if not result:
+        return "No matching products found."
+    return "Matching products: " + ", ".join(p["Product Name"] for p in result)
+
+
+def _format_top(result, feature, products):
+    unit = get_unit_for_feature(feature, products)
+    return "Top products: " + ", ".join(
+        f"{p['Product Name']} ({get_feature_value(p, feature)} {unit})" for p in result
+    )
+
+
+def _answer_details(ctx):
+    # Handle "Show details" / "Tell me about" / "Give me specs" type questions
+    if _DETAIL_PHRASES.isdisjoint(ctx["hits"]):
+        return None
+    if ctx["product_name"]:
+        product = get_product_by_name(ctx["products"], ctx["product_name"])
+        if product:
+            return format_product_details(product)
+    return "Product not found."
+
+
+def _answer_product_feature(ctx):
+    # If we have a specific product and a feature, get the specific value
+    feature = ctx["feature"]
+    if not (ctx["product_name"] and feature):
+        return None
+    product = get_product_by_name(ctx["products"], ctx["product_name"])
+    if product and get_feature_value(product, feature) is not None:
+        return _format_single(product, feature, ctx["products"])
+    return None
+
+
+def _answer_high_low(ctx):
     # Handle "highest/lowest" questions about a feature
-    if any(x in q for x in ["highest", "lowest", "highest number", "lowest number"]):
-        if feature:
-            if "highest" in q:
-                intent = "max"
-            else:
-                intent = "min"
-            
-            result = apply_filter(products, feature, intent, question)
-            if result and len(result) == 1:
-                p = result[0]
-                value = get_feature_value(p, feature)
-                unit = get_unit_for_feature(feature, products)
-                return f"{p['Product Name']} has {format_feature_name(feature)} of {value} {unit}.".strip()
-            elif result:
-                return "Matching products: " + ", ".join(p["Product Name"] for p in result)
+    hits, feature, products = ctx["hits"], ctx["feature"], ctx["products"]
+    if _HIGH_LOW_PHRASES.isdisjoint(hits) or not feature:
+        return None
     
+    intent = "max" if "highest" in hits else "min"
+    result = apply_filter(products, feature, intent, ctx["question"])
+    if len(result) == 1:
+        return _format_single(result[0], feature, products)
+    if result:
+        return _format_matches(result)
+    return None
+
+
+def _answer_top_n(ctx):
     # Handle "top N" questions - return exactly N products
-    if "top" in q and feature:
-        intent = "top"
-        numbers = extract_numbers(question)
-        n = int(numbers[0]) if numbers else 1
-        
-        # Get sorted products
-        numeric_key = feature + "_num"
-        if numeric_key in products[0]:
-            sorted_products = sorted(products, key=lambda x: x.get(numeric_key, 0), reverse=True)
-            # Handle ties - include all products that have the same value as the nth product
-            if n < len(sorted_products):
-                threshold_value = sorted_products[n-1].get(numeric_key, 0)
-                # Include all products with value >= threshold
-                result = [p for p in sorted_products if p.get(numeric_key, 0) >= threshold_value]
-            else:
-                result = sorted_products[:n]
-            if result:
-                unit = get_unit_for_feature(feature, products)
-                return "Top products: " + ", ".join(
-                    f"{p['Product Name']} ({get_feature_value(p, feature)} {unit})" for p in result
-                )
+    feature, products = ctx["feature"], ctx["products"]
+    if "top" not in ctx["hits"] or not feature:
+        return None
+    
+    numbers = extract_numbers(ctx["question"])
+    n = int(numbers[0]) if numbers else 1
     
+    # Get sorted products; the precomputed ranking is the full order whenever
+    # every product has the feature, otherwise missing values sort as 0
+    numeric_key = get_numeric_key(feature)
+    index = get_index(products)
+    if numeric_key not in index["available"]:
+        return None
+    
+    sorted_products = index["rankings"][numeric_key][0]
+    if len(sorted_products) < len(products):
+        sorted_products = sorted(products, key=lambda x: x.get(numeric_key, 0), reverse=True)
+    # Handle ties - include all products that have the same value as the nth product
+    if n < len(sorted_products):
+        threshold_value = sorted_products[n-1].get(numeric_key, 0)
+        # Include all products with value >= threshold
+        result = [p for p in sorted_products if p.get(numeric_key, 0) >= threshold_value]
+    else:
+        result = sorted_products[:n]
+    
+    if result:
+        return _format_top(result, feature, products)
+    return None
+
+
+def _answer_and_conditions(ctx):
     # Handle AND conditions FIRST - before single "between" check
-    if " and " in q:
-        filtered_products = products
-        
-        # Parse the question to find all conditions
-        conditions = []
-        nums = extract_numbers(q)
-        
-        # Track which numbers have been used
-        used_nums = []
-        
-        def get_next_nums(count, used):
-            """Get next 'count' numbers that haven't been used"""
-            result = []
-            for n in nums:
-                if n not in used and len(result) < count:
-                    result.append(n)
-            return result
-        
-        # Check for duty cycle conditions FIRST (before capacity)
-        if "duty cycle" in q or "duty" in q:
-            if "between" in q and len(nums) >= 2:
-                pair = get_next_nums(2, used_nums)
-                if len(pair) >= 2:
-                    conditions.append(("Duty Cycle", "between", pair[0], pair[1]))
-                    used_nums.extend(pair)
-            elif any(x in q for x in ["more than", "above"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Duty Cycle", "greater", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["less than", "below"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Duty Cycle", "less", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["at least"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Duty Cycle", "atleast", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["at most"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Duty Cycle", "atmost", val[0]))
-                    used_nums.append(val[0])
-        
-        # Check for speed conditions
-        if "speed" in q or "m/s" in q:
-            if "between" in q and len(nums) >= 2:
-                pair = get_next_nums(2, used_nums)
-                if len(pair) >= 2:
-                    conditions.append(("Speed", "between", pair[0], pair[1]))
-                    used_nums.extend(pair)
-            elif any(x in q for x in ["more than", "above"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Speed", "greater", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["less than", "below"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Speed", "less", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["at least"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Speed", "atleast", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["at most"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Speed", "atmost", val[0]))
-                    used_nums.append(val[0])
-        
-        # Check for capacity conditions (after duty cycle)
-        if "capacity" in q or "kg" in q:
-            if "between" in q and len(nums) >= 2:
-                pair = get_next_nums(2, used_nums)
-                if len(pair) >= 2:
-                    conditions.append(("Capacity", "between", pair[0], pair[1]))
-                    used_nums.extend(pair)
-            elif any(x in q for x in ["more than", "above", "greater than"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Capacity", "greater", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["less than", "below", "under"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Capacity", "less", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["at least", "minimum"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Capacity", "atleast", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["at most", "maximum"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Capacity", "atmost", val[0]))
-                    used_nums.append(val[0])
-        
-        # Check for floor conditions
-        if "floor" in q:
-            if "between" in q and len(nums) >= 2:
-                pair = get_next_nums(2, used_nums)
-                if len(pair) >= 2:
-                    conditions.append(("Floor", "between", pair[0], pair[1]))
-                    used_nums.extend(pair)
-            elif any(x in q for x in ["more than", "above", "greater than"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Floor", "greater", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["less than", "below", "under"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Floor", "less", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["at least", "minimum"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Floor", "atleast", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["at most", "maximum"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Floor", "atmost", val[0]))
-                    used_nums.append(val[0])
-        
-        # Check for duty cycle conditions
-        if "duty cycle" in q or "duty" in q:
-            if "between" in q and len(nums) >= 2:
-                pair = get_next_nums(2, used_nums)
-                if len(pair) >= 2:
-                    conditions.append(("Duty Cycle", "between", pair[0], pair[1]))
-                    used_nums.extend(pair)
-            elif any(x in q for x in ["more than", "above"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Duty Cycle", "greater", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["less than", "below"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Duty Cycle", "less", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["at least"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Duty Cycle", "atleast", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["at most"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Duty Cycle", "atmost", val[0]))
-                    used_nums.append(val[0])
-        
-        # Check for speed conditions
-        if "speed" in q or "m/s" in q:
-            if "between" in q and len(nums) >= 2:
-                pair = get_next_nums(2, used_nums)
-                if len(pair) >= 2:
-                    conditions.append(("Speed", "between", pair[0], pair[1]))
-                    used_nums.extend(pair)
-            elif any(x in q for x in ["more than", "above"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Speed", "greater", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["less than", "below"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Speed", "less", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["at least"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Speed", "atleast", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["at most"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Speed", "atmost", val[0]))
-                    used_nums.append(val[0])
-        
-        # Check for power conditions
-        if "power" in q or "kw" in q:
-            if "between" in q and len(nums) >= 2:
-                pair = get_next_nums(2, used_nums)
-                if len(pair) >= 2:
-                    conditions.append(("Power", "between", pair[0], pair[1]))
-                    used_nums.extend(pair)
-            elif any(x in q for x in ["more than", "above"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Power", "greater", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["less than", "below"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Power", "less", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["at least"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Power", "atleast", val[0]))
-                    used_nums.append(val[0])
-            elif any(x in q for x in ["at most"]) and nums:
-                val = get_next_nums(1, used_nums)
-                if val:
-                    conditions.append(("Power", "atmost", val[0]))
-                    used_nums.append(val[0])
-        
-        # Apply all conditions
-        for feat, intent, *values in conditions:
-            numeric_key = feat + "_num"
-            if numeric_key not in products[0]:
-                continue
-            
-            if intent == "between" and len(values) >= 2:
-                low, high = values[0], values[1]
-                filtered_products = [p for p in filtered_products if low <= p.get(numeric_key, 0) <= high]
-            elif intent == "greater" and values:
-                filtered_products = [p for p in filtered_products if p.get(numeric_key, 0) > values[0]]
-            elif intent == "less" and values:
-                filtered_products = [p for p in filtered_products if p.get(numeric_key, 0) < values[0]]
-            elif intent == "atleast" and values:
-                filtered_products = [p for p in filtered_products if p.get(numeric_key, 0) >= values[0]]
-            elif intent == "atmost" and values:
-                filtered_products = [p for p in filtered_products if p.get(numeric_key, 0) <= values[0]]
-        
-        if not filtered_products:
-            return "No matching products found."
+    hits, products = ctx["hits"], ctx["products"]
+    if " and " not in hits:
+        return None
+    
+    # Parse the question to find all conditions, one spec at a time
+    conditions = []
+    nums = extract_numbers(ctx["q"])
+    remaining = deque(nums)
+    
+    for feat, triggers, comparisons in _CONDITION_SPECS:
+        if not triggers.isdisjoint(hits):
+            condition = parse_condition(hits, feat, comparisons, nums, remaining)
+            if condition:
+                conditions.append(condition)
+    
+    # Apply all conditions
+    index = get_index(products)
+    filtered_products = products
+    for feat, intent, *values in conditions:
+        numeric_key = get_numeric_key(feat)
+        if numeric_key not in index["available"]:
+            continue
         
-        return "Matching products: " + ", ".join(p["Product Name"] for p in filtered_products)
+        if intent == "between" and len(values) >= 2:
+            low, high = values[0], values[1]
+            filtered_products = [p for p in filtered_products if low <= p.get(numeric_key, 0) <= high]
+        elif intent == "greater" and values:
+            filtered_products = [p for p in filtered_products if p.get(numeric_key, 0) > values[0]]
+        elif intent == "less" and values:
+            filtered_products = [p for p in filtered_products if p.get(numeric_key, 0) < values[0]]
+        elif intent == "atleast" and values:
+            filtered_products = [p for p in filtered_products if p.get(numeric_key, 0) >= values[0]]
+        elif intent == "atmost" and values:
+            filtered_products = [p for p in filtered_products if p.get(numeric_key, 0) <= values[0]]
+    
+    if not filtered_products:
+        return "No matching products found."
     
+    return "Matching products: " + ", ".join(p["Product Name"] for p in filtered_products)
+
+
+def _answer_between(ctx):
     # Handle single "between" questions (without "and")
-    if " between " in q and feature:
-        intent = "between"
-        result = apply_filter(products, feature, intent, question)
-        if not result:
-            return "No matching products found."
-        return "Matching products: " + ", ".join(p["Product Name"] for p in result)
-    
+    if " between " not in ctx["hits"] or not ctx["feature"]:
+        return None
+    return _format_matches(apply_filter(ctx["products"], ctx["feature"], "between", ctx["question"]))
+
+
+def _answer_comparison(ctx):
     # Handle "more than" / "less than" / "at least" / "at most" questions
-    if any(x in q for x in ["more than", "less than", "at least", "at most", "above", "below", "under"]):
-        if feature:
-            intent = detect_intent(question)
-            result = apply_filter(products, feature, intent, question)
-            if not result:
-                return "No matching products found."
-            return "Matching products: " + ", ".join(p["Product Name"] for p in result)
-    
-    # Single condition
-    intent = detect_intent(question)
-    if feature is None:
-        feature = detect_feature(question, products)
-    
-    if not feature:
+    if _COMPARISON_PHRASES.isdisjoint(ctx["hits"]) or not ctx["feature"]:
+        return None
+    intent = detect_intent(ctx["question"])
+    return _format_matches(apply_filter(ctx["products"], ctx["feature"], intent, ctx["question"]))
+
+
+def _answer_no_feature(ctx):
+    if not ctx["feature"]:
         return "Could not detect feature."
-    
+    return None
+
+
+def _answer_customization(ctx):
     # Handle Customization queries
-    if feature == "Customization":
-        # Check if a specific product is mentioned
-        product_name = detect_product_name(question, products)
-        if product_name:
-            # Return customization for specific product
-            for p in products:
-                if p["Product Name"] == product_name:
-                    cust = p.get("Customization", "")
-                    if cust:
-                        return f"{p['Product Name']} has the following customization options: {cust}"
-                    return f"No customization information available for {product_name}."
-        # Return customization options for all products
-        result = []
-        for p in products:
-            cust = p.get("Customization", "")
-            if cust:
-                result.append(f"{p['Product Name']}: {cust}")
-        if result:
-            return "Customization options available:\n" + "\n".join(result)
-        return "No customization information available."
+    if ctx["feature"] != "Customization":
+        return None
+    products, product_name = ctx["products"], ctx["product_name"]
     
-    # Handle Benefit queries
-    if feature == "Benefit":
-        # Check if a specific product is mentioned
-        product_name = detect_product_name(question, products)
-        if product_name:
-            # Return benefits for specific product
-            for p in products:
-                if p["Product Name"] == product_name:
-                    benefit = p.get("Benefit", "")
-                    if benefit:
-                        return f"{p['Product Name']} has the following benefits: {benefit}"
-                    return f"No benefit information available for {product_name}."
-        # Return benefits for all products
-        result = []
+    # Check if a specific product is mentioned
+    if product_name:
+        # Return customization for specific product
         for p in products:
-            benefit = p.get("Benefit", "")
-            if benefit:
-                result.append(f"{p['Product Name']}: {benefit}")
-        if result:
-            return "Benefits available:\n" + "\n".join(result)
-        return "No benefit information available."
+            if p["Product Name"] == product_name:
+                cust = p.get("Customization", "")
+                if cust:
+                    return f"{p['Product Name']} has the following customization options: {cust}"
+                return f"No customization information available for {product_name}."
+    
+    # Return customization options for all products
+    result = []
+    for p in products:
+        cust = p.get("Customization", "")
+        if cust:
+            result.append(f"{p['Product Name']}: {cust}")
+    if result:
+        return "Customization options available:\n" + "\n".join(result)
+    return "No customization information available."
+
+
+def _answer_benefit(ctx):
+    # Handle Benefit queries
+    if ctx["feature"] != "Benefit":
+        return None
+    products, product_name = ctx["products"], ctx["product_name"]
     
-    result = apply_filter(products, feature, intent, question)
+    # Check if a specific product is mentioned
+    if product_name:
+        # Return benefits for specific product
+        for p in products:
+            if p["Product Name"] == product_name:
+                benefit = p.get("Benefit", "")
+                if benefit:
+                    return f"{p['Product Name']} has the following benefits: {benefit}"
+                return f"No benefit information available for {product_name}."
+    
+    # Return benefits for all products
+    result = []
+    for p in products:
+        benefit = p.get("Benefit", "")
+        if benefit:
+            result.append(f"{p['Product Name']}: {benefit}")
+    if result:
+        return "Benefits available:\n" + "\n".join(result)
+    return "No benefit information available."
+
+
+def _answer_single_condition(ctx):
+    # Single condition - the fallback, always answers
+    feature, products = ctx["feature"], ctx["products"]
+    intent = detect_intent(ctx["question"])
+    result = apply_filter(products, feature, intent, ctx["question"])
     
     if not result:
         return "No matching products found."
     
     if intent in ["max", "min"]:
-        p = result[0]
-        value = get_feature_value(p, feature)
-        unit = get_unit_for_feature(feature, products)
-        return f"{p['Product Name']} has {format_feature_name(feature)} of {value} {unit}.".strip()
+        return _format_single(result[0], feature, products)
     
     if intent == "top":
-        unit = get_unit_for_feature(feature, products)
-        return "Top products: " + ", ".join(
-            f"{p['Product Name']} ({get_feature_value(p, feature)} {unit})" for p in result
-        )
+        return _format_top(result, feature, products)
     
-    return "Matching products: " + ", ".join(p["Product Name"] for p in result)
+    return _format_matches(result)
+
+
+# Order matters: earlier handlers win, e.g. AND conditions are tried before
+# the single "between" check
+_ANSWER_HANDLERS = (
+    _answer_details,
+    _answer_product_feature,
+    _answer_high_low,
+    _answer_top_n,
+    _answer_and_conditions,
+    _answer_between,
+    _answer_comparison,
+    _answer_no_feature,
+    _answer_customization,
+    _answer_benefit,
+    _answer_single_condition,
+)
+
+
+# ==========================================================
+# ANSWER ENGINE
+# ==========================================================
+def compute_answer(question, products):
+    q = question.lower()
+    ctx = {
+        "question": question,
+        "q": q,
+        "products": products,
+        "hits": scan_keywords(q),
+        # Every handler asks about the same product and feature, so detect them once
+        "product_name": detect_product_name(q, products),
+        "feature": detect_feature(question, products),
+    }
+    
+    for handler in _ANSWER_HANDLERS:
+        answer = handler(ctx)
+        if answer is not None:
+            return answer
+
+
+# ==========================================================
+# ANSWER CACHE
+# ==========================================================
+def answer_question(question, products):
+    # Answers about the loaded catalog are memoized on the normalized
+    # question; index_products clears the cache when the catalog is reloaded
+    if products is _INDEXED_PRODUCTS:
+        return _cached_answer(question.strip().lower())
+    return compute_answer(question, products)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_answer(q):
+    return compute_answer(q, _INDEXED_PRODUCTS)
 
 
 # ==========================================================
 # FORMAT PRODUCT DETAILS
 # ==========================================================
+# (key, line template) in display order. Key specs are skipped when missing
+# or None; raw catalog fields are shown whenever the column exists.
+_DETAIL_SPECS = (
+    ("Capacity", "Maximum Capacity: {} kg"),
+    ("Floor", "Maximum Floors: {}"),
+    ("Duty Cycle", "Duty Cycle: {}"),
+    ("Speed", "Maximum Speed: {} m/s"),
+    ("Power", "Maximum Power: {} kW"),
+)
+_RAW_DETAIL_SPECS = (
+    ("Product Type", "Product Type: {}"),
+    ("Application Range", "Application Range: {}"),
+)
+
+
 def format_product_details(product):
-    lines = []
-    lines.append(f"=== {product.get('Product Name', 'Unknown')} ===")
+    lines = [f"=== {product.get('Product Name', 'Unknown')} ==="]
     
     # Key specs
-    if "Capacity" in product and product["Capacity"] is not None:
-        lines.append(f"Maximum Capacity: {product['Capacity']} kg")
-    if "Floor" in product and product["Floor"] is not None:
-        lines.append(f"Maximum Floors: {product['Floor']}")
-    if "Duty Cycle" in product and product["Duty Cycle"] is not None:
-        lines.append(f"Duty Cycle: {product['Duty Cycle']}")
-    if "Speed" in product and product["Speed"] is not None:
-        lines.append(f"Maximum Speed: {product['Speed']} m/s")
-    if "Power" in product and product["Power"] is not None:
-        lines.append(f"Maximum Power: {product['Power']} kW")
-    
-    # Product Type
-    if "Product Type" in product:
-        lines.append(f"Product Type: {product['Product Type']}")
-    
-    # Application Range
-    if "Application Range" in product:
-        lines.append(f"Application Range: {product['Application Range']}")
+    lines.extend(
+        template.format(product[key])
+        for key, template in _DETAIL_SPECS
+        if product.get(key) is not None
+    )
+    
+    # Product Type / Application Range
+    raw = product.get("_raw", {})
+    lines.extend(template.format(raw[key]) for key, template in _RAW_DETAIL_SPECS if key in raw)
     
     return "\n".join(lines)
 
@@ -10,7 +10,8 @@ Note: This module now imports patterns from separate modules:
 """
 
 import re
-from typing import Dict, Any, Tuple
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 from collections import Counter
 
 # Import patterns from separate modules
@@ -19,11 +20,11 @@ from modules.create_patterns import (
     NOT_CREATE_KEYWORDS,
     extract_create_details,
     is_create_intent,
-    CREATE_PATTERNS
+    CREATE_ANY_REGEX_LOWER
 )
 
 from modules.cancel_patterns import (
-    CANCEL_PATTERNS,
+    CANCEL_ANY_REGEX_LOWER,
     CANCEL_KEYWORDS,
     CANCEL_KW_SET,
     is_cancel_pattern,
@@ -33,8 +34,8 @@ from modules.cancel_patterns import (
 )
 
 from modules.update_patterns import (
-    UPDATE_PATTERNS,
-    RESCHEDULE_PATTERNS,
+    UPDATE_ANY_REGEX_LOWER,
+    RESCHEDULE_ANY_REGEX_LOWER,
     UPDATE_KEYWORDS,
     RESCHEDULE_KEYWORDS,
     UPDATE_RESCHEDULE_KW_SET,
@@ -47,7 +48,7 @@ from modules.update_patterns import (
 )
 
 from modules.list_events_patterns import (
-    LIST_PATTERNS,
+    LIST_ANY_REGEX_LOWER,
     LIST_KEYWORDS,
     EVENT_WORDS,
     extract_list_event_details,
@@ -83,67 +84,33 @@ def detect_action(sentence: str) -> Tuple[bool, bool, bool, bool, bool]:
     Returns:
         Tuple of (is_create, is_cancel, is_update, is_reschedule, is_list_events) booleans
     """
-    import traceback
-    # Get the calling function name
-    stack = traceback.extract_stack()
-    caller = stack[-2] if len(stack) > 2 else None
-    caller_name = caller.name if caller else 'unknown'
-    
-    # Debug print
-    print(f"\n=== DEBUG detect_action ===")
-    print(f"Sentence: '{sentence}'")
-    print(f"Called from: {caller_name}")
-    
+    # Every check is case-insensitive, so the result only depends on the
+    # normalized text and repeated sentences are answered from the cache
+    return _detect_action_normalized(sentence.strip().lower())
+
+
+@lru_cache(maxsize=4096)
+def _detect_action_normalized(sentence: str) -> Tuple[bool, bool, bool, bool, bool]:
+    """Cached body of detect_action; ``sentence`` is already stripped and lowercased."""
     # Check list events first (has its own detection logic)
-    print("\n--- Checking LIST_EVENTS_PATTERNS ---")
-    is_list_events = False
-    for p in LIST_PATTERNS:
-        match = re.search(p, sentence, re.IGNORECASE)
-        if match:
-            is_list_events = True
-            print(f"MATCHED: '{p}' -> '{match.group(0)}'")
-            break
-    print(f"is_list_events = {is_list_events}")
+    is_list_events = LIST_ANY_REGEX_LOWER.search(sentence) is not None
     
-    # Check cancel first
-    print("\n--- Checking CANCEL_PATTERNS ---")
-    is_cancel = False
-    for p in CANCEL_PATTERNS:
-        match = re.search(p, sentence, re.IGNORECASE)
-        if match:
-            is_cancel = True
-            print(f"MATCHED: '{p}' -> '{match.group(0)}'")
-    print(f"is_cancel = {is_cancel}")
+    # Check cancel
+    is_cancel = CANCEL_ANY_REGEX_LOWER.search(sentence) is not None
     
     # Check update
-    print("\n--- Checking UPDATE_PATTERNS ---")
-    is_update = any(re.search(p, sentence, re.IGNORECASE) for p in UPDATE_PATTERNS)
-    print(f"is_update = {is_update}")
+    is_update = UPDATE_ANY_REGEX_LOWER.search(sentence) is not None
     
     # Check reschedule
-    print("\n--- Checking RESCHEDULE_PATTERNS ---")
-    is_reschedule = any(re.search(p, sentence, re.IGNORECASE) for p in RESCHEDULE_PATTERNS)
-    print(f"is_reschedule = {is_reschedule}")
+    is_reschedule = RESCHEDULE_ANY_REGEX_LOWER.search(sentence) is not None
     
     # Check create (only if no cancel/update/reschedule/list_events)
-    print("\n--- Checking CREATE_PATTERNS ---")
     is_create = False
     if not (is_cancel or is_update or is_reschedule or is_list_events):
-        for p in CREATE_PATTERNS:
-            match = re.search(p, sentence, re.IGNORECASE)
-            if match:
-                is_create = True
-                print(f"MATCHED: '{p}' -> '{match.group(0)}'")
-                break
+        is_create = CREATE_ANY_REGEX_LOWER.search(sentence) is not None
         # Also check with extract_create_details as backup
         if not is_create:
-            create_details = extract_create_details(sentence)
-            is_create = create_details.get('is_create', False)
-            if is_create:
-                print(f"extract_create_details: {create_details.get('signals', [])}")
-    
-    print(f"\n=== FINAL RESULT ===")
-    print(f"is_create={is_create}, is_cancel={is_cancel}, is_update={is_update}, is_reschedule={is_reschedule}, is_list_events={is_list_events}")
+            is_create = extract_create_details(sentence).get('is_create', False)
     
     return is_create, is_cancel, is_update, is_reschedule, is_list_events
 
@@ -161,6 +128,15 @@ CANCEL_KEYWORDS_LIST = [
 ]
 
 
+# Every keyword as one literal alternation: a single pass over the sentence
+# finds any of them as a substring
+CREATE_KEYWORD_REGEX = re.compile("|".join(re.escape(keyword.lower()) for keyword in CREATE_KEYWORDS))
+
+# Meeting words that make extract_action_intent default to create
+FALLBACK_MEETING_WORDS = ('meeting', 'call', 'event', 'appointment', 'standup', 'sync')
+FALLBACK_MEETING_REGEX = re.compile("|".join(FALLBACK_MEETING_WORDS))
+
+
 def has_create_keyword(sentence: str) -> bool:
     """
     Check if the sentence contains any create keyword.
@@ -171,8 +147,7 @@ def has_create_keyword(sentence: str) -> bool:
     Returns:
         True if the sentence contains any create keyword
     """
-    text_lower = sentence.lower()
-    return any(keyword.lower() in text_lower for keyword in CREATE_KEYWORDS)
+    return CREATE_KEYWORD_REGEX.search(sentence.lower()) is not None
 
 
 def extract_action_intent(sentence: str) -> Dict[str, str]:
@@ -185,6 +160,29 @@ def extract_action_intent(sentence: str) -> Dict[str, str]:
     Returns:
         Dictionary with action and intent
     """
+    # Callers are free to modify the result, so rebuild fresh dicts from the
+    # cached snapshot instead of handing out shared ones
+    fields, time_period = _extract_action_intent_cached(sentence)
+    result = dict(fields)
+    if time_period is not None:
+        time_info = dict(time_period)
+        time_info['signals'] = list(time_info['signals'])
+        result["time_period"] = time_info
+    return result
+
+
+@lru_cache(maxsize=2048)
+def _extract_action_intent_cached(sentence: str) -> Tuple[tuple, Optional[tuple]]:
+    """Cached extract_action_intent result as immutable (items, time_period items)."""
+    result = _detect_action_intent(sentence)
+    time_info = result.pop("time_period", None)
+    if time_info is not None:
+        time_info = tuple({**time_info, 'signals': tuple(time_info['signals'])}.items())
+    return tuple(result.items()), time_info
+
+
+def _detect_action_intent(sentence: str) -> Dict[str, Any]:
+    """Uncached body of extract_action_intent."""
     # Pattern-based detection
     is_create, is_cancel, is_update, is_reschedule, is_list_events = detect_action(sentence)
     
@@ -212,11 +210,11 @@ def extract_action_intent(sentence: str) -> Dict[str, str]:
     
     # Default: assume create if meeting-related words are present
     text_lower = sentence.lower()
-    if any(word in text_lower for word in ['meeting', 'call', 'event', 'appointment', 'standup', 'sync']):
+    if FALLBACK_MEETING_REGEX.search(text_lower):
         return {"action": "create", "intent": "schedule_meeting"}
     
     # Last resort: check for create keywords without meeting words
-    if has_create_keyword(sentence):
+    if CREATE_KEYWORD_REGEX.search(text_lower):
         return {"action": "create", "intent": "schedule_meeting"}
     
     return {"action": "unknown", "intent": None}
@@ -3,59 +3,169 @@ Meeting Attendees Extraction Module
 Extracts meeting attendees from natural language sentences.
 """
 
+import json
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Optional
+
+from config import load_json
+
+
+# Patterns compiled once at import instead of on every call
+EMAIL_REGEX = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+VALID_EMAIL_REGEX = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+WORD_REGEX = re.compile(r'\b\w+\b')
+TEAM_REGEXES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\bwith\s+(.+?)\s+team\b',
+    r'\bwith\s+(.+?)\s+team\s+(?:members|colleagues|people)?\b',
+    r'\b(.+?)\s+team\b',
+))
+
+
+# Entries in names.json that are never treated as attendee names
+NON_NAME_WORDS = frozenset({'me', 'and', 'or', 'everyone', 'all'})
 
 
 def load_email_book() -> List[Dict[str, str]]:
     """Load email book from config file."""
-    import json
-    import os
-    email_file = os.path.join(os.path.dirname(__file__), '..', 'config', 'email.json')
     try:
-        with open(email_file, 'r') as f:
-            return json.load(f)
+        return load_json('email.json')
     except (FileNotFoundError, json.JSONDecodeError):
         return []
 
 
 def load_names_database() -> Dict:
     """Load names database from config file."""
-    import json
-    import os
-    names_file = os.path.join(os.path.dirname(__file__), '..', 'config', 'names.json')
     try:
-        with open(names_file, 'r') as f:
-            return json.load(f)
+        return load_json('names.json')
     except (FileNotFoundError, json.JSONDecodeError):
         return {"names": []}
 
 
 def load_teams() -> Dict[str, Dict]:
     """Load teams from config file."""
-    import json
-    import os
-    teams_file = os.path.join(os.path.dirname(__file__), '..', 'config', 'teams.json')
     try:
-        with open(teams_file, 'r') as f:
-            data = json.load(f)
-            return data.get('teams', {})
+        data = load_json('teams.json')
+        return data.get('teams', {})
     except (FileNotFoundError, json.JSONDecodeError):
         return {}
 
 
+def load_exclusion_words() -> set:
+    """Load exclusion words from config file."""
+    try:
+        data = load_json('exclusion_words.json')
+        return set(word.lower() for word in data.get('exclusion_words', []))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return set()
+
+
+def build_email_index(email_book: List[Dict[str, str]]) -> Dict[str, str]:
+    """
+    Map lowercased names and first names to emails for O(1) lookup.
+    
+    The first entry that mentions a name wins, matching a front-to-back scan.
+    """
+    index = {}
+    for entry in email_book:
+        email = entry.get('email', '')
+        for key in (entry.get('name', '').lower(), entry.get('first_name', '').lower()):
+            if key:
+                index.setdefault(key, email)
+    return index
+
+
+def build_name_index(names_database: Dict, email_book: List[Dict[str, str]]) -> Dict[str, Dict[str, str]]:
+    """Map lowercased names from names.json, then email.json, to their name and email."""
+    names_list = names_database.get('names', [])
+    
+    valid_names = {}
+    for name_entry in names_list:
+        display_name = name_entry.get('display_name', '')
+        first_name = name_entry.get('first_name', '')
+        email = name_entry.get('email', '')
+        if display_name:
+            valid_names[display_name.lower()] = {'name': display_name, 'email': email}
+        if first_name and first_name != display_name:
+            valid_names[first_name.lower()] = {'name': first_name, 'email': email}
+    
+    # email.json only fills in names that names.json doesn't define
+    for entry in email_book:
+        name = entry.get('name', '')
+        email = entry.get('email', '')
+        if name:
+            name_lower = name.lower()
+            if name_lower not in valid_names:
+                valid_names[name_lower] = {'name': name, 'email': email}
+    
+    return valid_names
+
+
+def build_team_index(teams: Dict[str, Dict]) -> Dict[str, List[tuple]]:
+    """
+    Map lowercased team names and aliases to ``(position, team, members)`` entries.
+    
+    Entries keep the config order, so the first one is the team a front-to-back
+    scan of teams.json would have found.
+    """
+    index = {}
+    for position, (team_key, team_data) in enumerate(teams.items()):
+        team_name = team_data.get('team', team_key)
+        entry = (position, team_name, team_data.get('members', []))
+        for name in [team_name] + team_data.get('aliases', []):
+            entries = index.setdefault(name.lower(), [])
+            if entry not in entries:
+                entries.append(entry)
+    return index
+
+
+# Built-in words that are never attendee names, on top of exclusion_words.json
+HARDCODED_INVALID_WORDS = frozenset({
+    'me', 'myself', 'my', 'we', 'us', 'our', 'ours', 'you', 'your', 'yours',
+    'him', 'her', 'his', 'hers', 'them', 'their', 'theirs', 'it', 'its',
+    'who', 'what', 'when', 'where', 'why', 'how', 'which', 'whom',
+    'this', 'that', 'these', 'those',
+    'meeting', 'call', 'chat', 'discussion', 'hangout',
+    'everyone', 'all', 'team', 'group', 'anyone', 'anybody',
+    'tomorrow', 'today', 'yesterday', 'morning', 'afternoon', 'evening',
+    'next', 'last', 'previous', 'current',
+    'email', 'text', 'message',
+    'finance', 'legal', 'engineering', 'sales', 'marketing', 'hr', 'human resources',
+    'support', 'operations',
+    'ceo', 'cto', 'cfo', 'coo', 'vp', 'director', 'manager', 'lead',
+    'sir', "ma'am", 'maam', 'madam', 'dr', 'prof', 'mr', 'mrs', 'miss',
+    'with', 'at', 'on', 'for', 'to', 'about', 'create', 'schedule',
+    '5pm', '5am', '10am', '10pm', '12pm', '12am', 'pm', 'am', 'noon', 'midnight',
+})
+
+# Config tables are read once at import; call reload_config() after editing the files
+EMAIL_BOOK = load_email_book()
+EMAIL_INDEX = build_email_index(EMAIL_BOOK)
+NAMES_DATABASE = load_names_database()
+NAME_INDEX = build_name_index(NAMES_DATABASE, EMAIL_BOOK)
+TEAMS = load_teams()
+TEAM_INDEX = build_team_index(TEAMS)
+INVALID_WORDS = frozenset(load_exclusion_words() | HARDCODED_INVALID_WORDS)
+
+
+def reload_config() -> None:
+    """Re-read the config files into the module-level tables."""
+    global EMAIL_BOOK, EMAIL_INDEX, NAMES_DATABASE, NAME_INDEX, TEAMS, TEAM_INDEX, INVALID_WORDS
+    EMAIL_BOOK = load_email_book()
+    EMAIL_INDEX = build_email_index(EMAIL_BOOK)
+    NAMES_DATABASE = load_names_database()
+    NAME_INDEX = build_name_index(NAMES_DATABASE, EMAIL_BOOK)
+    TEAMS = load_teams()
+    TEAM_INDEX = build_team_index(TEAMS)
+    INVALID_WORDS = frozenset(load_exclusion_words() | HARDCODED_INVALID_WORDS)
+
+
 def get_team_members(team_name: str, email_book: List[Dict[str, str]] = None) -> List[str]:
     """Get list of email addresses for a team."""
-    teams = load_teams()
     team_name_lower = team_name.lower().strip()
     
-    for team_key, team_data in teams.items():
-        team_name = team_data.get('team', team_key)
-        aliases = team_data.get('aliases', [])
-        
-        if (team_name_lower == team_name.lower() or 
-            team_name_lower in [a.lower() for a in aliases]):
-            return team_data.get('members', [])
+    entries = TEAM_INDEX.get(team_name_lower)
+    if entries:
+        return entries[0][2]
     
     if email_book:
         for team in email_book:
@@ -67,89 +177,43 @@ def get_team_members(team_name: str, email_book: List[Dict[str, str]] = None) ->
 
 def extract_team_names(sentence: str) -> List[str]:
     """Extract team names from natural language sentence."""
-    teams = load_teams()
     sentence_lower = sentence.lower()
     found_teams = []
     
-    team_patterns = [
-        r'\bwith\s+(.+?)\s+team\b',
-        r'\bwith\s+(.+?)\s+team\s+(?:members|colleagues|people)?\b',
-        r'\b(.+?)\s+team\b',
-    ]
+    # Every team pattern needs a literal "team"; without one the lazy (.+?)
+    # groups would retry from every word boundary before failing
+    if 'team' not in sentence_lower:
+        return found_teams
     
-    for pattern in team_patterns:
-        matches = re.findall(pattern, sentence_lower, re.IGNORECASE)
+    for regex in TEAM_REGEXES:
+        matches = regex.findall(sentence_lower)
         for match in matches:
             team_name = match.strip()
-            for team_key, team_data in teams.items():
-                team_name_orig = team_data.get('team', team_key)
-                aliases = team_data.get('aliases', [])
-                all_names = [team_name_orig.lower()] + [a.lower() for a in aliases]
-                if team_name in all_names:
-                    if team_name_orig not in found_teams:
-                        found_teams.append(team_name_orig)
-                if team_name + ' team' in all_names or team_name in all_names:
-                    if team_name_orig not in found_teams:
-                        found_teams.append(team_name_orig)
+            # "dm" matches as an alias or as the "dm team" canonical name
+            entries = TEAM_INDEX.get(team_name, []) + TEAM_INDEX.get(team_name + ' team', [])
+            for _, team_name_orig, _ in sorted(entries):
+                if team_name_orig not in found_teams:
+                    found_teams.append(team_name_orig)
     
     return found_teams
 
 
 def is_valid_email(email: str) -> bool:
     """Check if a string is a valid email address."""
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(email_pattern, email.strip()))
-
-
-def load_exclusion_words() -> set:
-    """Load exclusion words from config file."""
-    import json
-    import os
-    exclusion_file = os.path.join(os.path.dirname(__file__), '..', 'config', 'exclusion_words.json')
-    try:
-        with open(exclusion_file, 'r') as f:
-            data = json.load(f)
-            return set(word.lower() for word in data.get('exclusion_words', []))
-    except (FileNotFoundError, json.JSONDecodeError):
-        return set()
-
-
-_exclusion_words_cache = None
+    # Names never contain '@', so reject them without entering the regex engine
+    if '@' not in email:
+        return False
+    return bool(VALID_EMAIL_REGEX.match(email.strip()))
 
 
-def get_invalid_words() -> set:
+def get_invalid_words() -> frozenset:
     """Get the set of invalid words (from config + hardcoded)."""
-    global _exclusion_words_cache
-    if _exclusion_words_cache is None:
-        config_words = load_exclusion_words()
-        hardcoded_words = {
-            'me', 'myself', 'my', 'we', 'us', 'our', 'ours', 'you', 'your', 'yours',
-            'him', 'her', 'his', 'hers', 'them', 'their', 'theirs', 'it', 'its',
-            'who', 'what', 'when', 'where', 'why', 'how', 'which', 'whom',
-            'this', 'that', 'these', 'those',
-            'meeting', 'call', 'chat', 'discussion', 'hangout',
-            'everyone', 'all', 'team', 'group', 'anyone', 'anybody',
-            'tomorrow', 'today', 'yesterday', 'morning', 'afternoon', 'evening',
-            'next', 'last', 'previous', 'current',
-            'email', 'text', 'message',
-            'finance', 'legal', 'engineering', 'sales', 'marketing', 'hr', 'human resources',
-            'support', 'operations',
-            'ceo', 'cto', 'cfo', 'coo', 'vp', 'director', 'manager', 'lead',
-            'sir', "ma'am", 'maam', 'madam', 'dr', 'prof', 'mr', 'mrs', 'miss',
-            'with', 'at', 'on', 'for', 'to', 'about', 'create', 'schedule',
-            '5pm', '5am', '10am', '10pm', '12pm', '12am', 'pm', 'am', 'noon', 'midnight',
-        }
-        _exclusion_words_cache = config_words.union(hardcoded_words)
-    return _exclusion_words_cache
+    return INVALID_WORDS
 
 
 def is_valid_name(name: str) -> bool:
     """Check if a name is valid (not a common false positive)."""
-    invalid_words = get_invalid_words()
-    name_lower = name.lower().strip()
-    if name_lower in invalid_words:
-        return False
-    return True
+    return name.lower().strip() not in INVALID_WORDS
 
 
 def extract_attendee_names(sentence: str) -> List[str]:
@@ -167,55 +231,33 @@ def extract_attendee_names(sentence: str) -> List[str]:
         List of attendee names
     """
     person_names = []
+    if not NAME_INDEX:
+        return person_names
     
-    # Load the names database
-    names_db = load_names_database()
-    names_list = names_db.get('names', [])
-    
-    # Create a set of all valid names (case-insensitive)
-    valid_names = {}
-    for name_entry in names_list:
-        display_name = name_entry.get('display_name', '')
-        first_name = name_entry.get('first_name', '')
-        email = name_entry.get('email', '')
-        if display_name:
-            valid_names[display_name.lower()] = {'name': display_name, 'email': email}
-        if first_name and first_name != display_name:
-            valid_names[first_name.lower()] = {'name': first_name, 'email': email}
-    
-    # Also load from email.json
-    email_book = load_email_book()
-    for entry in email_book:
-        name = entry.get('name', '')
-        email = entry.get('email', '')
-        if name:
-            name_lower = name.lower()
-            if name_lower not in valid_names:
-                valid_names[name_lower] = {'name': name, 'email': email}
-    
-    # Split sentence into words and check each word against valid names
-    words = re.findall(r'\b\w+\b', sentence)
+    # Split the lowercased sentence into words (one lower() instead of one per word)
+    words = WORD_REGEX.findall(sentence.lower())
     
-    # Check each word in the sentence against valid names
+    # Check each word against valid names, dropping non-name words and duplicates in one pass
+    seen_names = set()
     for word in words:
-        word_lower = word.lower()
-        if word_lower in valid_names:
-            name_info = valid_names[word_lower]
-            # Avoid duplicates
-            if name_info['name'] not in person_names:
-                person_names.append(name_info['name'])
-    
-    # Filter out common non-name words
-    person_names = [name for name in person_names if name.lower() not in ['me', 'and', 'or', 'everyone', 'all']]
-    person_names = [name for name in person_names if ',' not in name]
+        name_info = NAME_INDEX.get(word)
+        if name_info is None:
+            continue
+        name = name_info['name']
+        if name in seen_names or name.lower() in NON_NAME_WORDS or ',' in name:
+            continue
+        seen_names.add(name)
+        person_names.append(name)
     
     return person_names
 
 
 def extract_attendee_emails(sentence: str) -> List[str]:
     """Extract email addresses directly mentioned in the sentence."""
-    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    emails = re.findall(email_pattern, sentence)
+    # Most sentences name people rather than addresses; skip the regex scan then
+    if '@' not in sentence:
+        return []
+    emails = EMAIL_REGEX.findall(sentence)
     return emails
 
 
@@ -223,11 +265,13 @@ def extract_team_attendees(sentence: str) -> List[Dict[str, str]]:
     """Extract team attendees from sentence and return as attendee dicts."""
     team_names = extract_team_names(sentence)
     attendees = []
+    seen_emails = set()
     
     for team_name in team_names:
         members = get_team_members(team_name)
         for member_email in members:
-            if {"email": member_email} not in attendees:
+            if member_email not in seen_emails:
+                seen_emails.add(member_email)
                 attendees.append({"email": member_email})
     
     return attendees
@@ -244,23 +288,55 @@ def extract_attendees(sentence: str, email_book: List[Dict[str, str]] = None) ->
     Returns:
         List of attendee dictionaries with email
     """
-    if email_book is None:
-        email_book = load_email_book()
+    email_book, email_index = _email_book_and_index(email_book)
+    return _extract_attendees_indexed(sentence, email_book, email_index)
+
+
+def extract_attendees_batch(sentences: Iterable[str], email_book: List[Dict[str, str]] = None) -> List[List[Dict[str, str]]]:
+    """
+    Extract attendees for several sentences against the same email book.
     
+    Args:
+        sentences: The natural language sentences to parse
+        email_book: Optional email book for attendee lookup
+        
+    Returns:
+        One list of attendee dictionaries per sentence, in input order
+    """
+    # Index a caller-supplied book once for the whole batch instead of per sentence
+    email_book, email_index = _email_book_and_index(email_book)
+    return [_extract_attendees_indexed(sentence, email_book, email_index) for sentence in sentences]
+
+
+def _email_book_and_index(email_book: Optional[List[Dict[str, str]]]) -> tuple:
+    """Pick the book to search and its name index."""
+    # The preloaded book (passed explicitly or not) already has its index built
+    if email_book is None or email_book is EMAIL_BOOK:
+        return EMAIL_BOOK, EMAIL_INDEX
+    return email_book, build_email_index(email_book)
+
+
+def _extract_attendees_indexed(sentence: str, email_book: List[Dict[str, str]], email_index: Dict[str, str]) -> List[Dict[str, str]]:
+    """Extract attendees from one sentence using an already built email index."""
     # First, extract any email addresses directly mentioned
     direct_emails = extract_attendee_emails(sentence)
     
+    # Name and team matching are case-insensitive, so both share one lowercased copy
+    sentence_lower = sentence.lower()
+    
     # Then, extract attendee names for lookup
-    person_names = extract_attendee_names(sentence)
+    person_names = extract_attendee_names(sentence_lower)
     
     # Also extract team attendees explicitly
-    team_attendees = extract_team_attendees(sentence)
+    team_attendees = extract_team_attendees(sentence_lower)
     
     attendees = []
+    seen_emails = set()
     
     # Add direct email addresses first
     for email in direct_emails:
-        if {"email": email} not in attendees:
+        if email not in seen_emails:
+            seen_emails.add(email)
             attendees.append({"email": email})
     
     # Process names for lookup in email book
@@ -275,29 +351,21 @@ def extract_attendees(sentence: str, email_book: List[Dict[str, str]] = None) ->
         team_members = get_team_members(person_name, email_book)
         if team_members:
             for member_email in team_members:
-                if {"email": member_email} not in attendees:
+                if member_email not in seen_emails:
+                    seen_emails.add(member_email)
                     attendees.append({"email": member_email})
         else:
             # Look up in email_book
-            found = False
-            for entry in email_book:
-                entry_name = entry.get('name', '')
-                entry_email = entry.get('email', '')
-                
-                if (entry_name.lower() == person_name_lower or 
-                    entry.get('first_name', '').lower() == person_name_lower):
-                    if {"email": entry_email} not in attendees:
-                        attendees.append({"email": entry_email})
-                    found = True
-                    break
-            
-            # If not found in email_book, don't create a fake email
-            if not found:
-                print(f"DEBUG: Name '{person_name}' not found in email book, skipping...")
+            entry_email = email_index.get(person_name_lower)
+            # If not found in email_book, skip the name rather than create a fake email
+            if entry_email is not None and entry_email not in seen_emails:
+                seen_emails.add(entry_email)
+                attendees.append({"email": entry_email})
     
     # Add team attendees
     for team_attendee in team_attendees:
-        if team_attendee not in attendees:
+        if team_attendee["email"] not in seen_emails:
+            seen_emails.add(team_attendee["email"])
             attendees.append(team_attendee)
     
     return attendees
@@ -4,6 +4,7 @@ Handles meeting requests that avoid meal times (breakfast, lunch, dinner).
 """
 
 import re
+from functools import lru_cache
 from typing import Tuple, Optional, Dict, Any
 from datetime import datetime, timezone, timedelta
 
@@ -17,11 +18,17 @@ MEAL_TIME_WINDOWS = {
     'snack': {'start': (15, 0), 'end': (16, 0)},      # 3:00 PM - 4:00 PM
 }
 
+# The same windows as (start, end) minutes since midnight, computed once
+MEAL_TIME_MINUTES = {
+    meal: (window['start'][0] * 60 + window['start'][1], window['end'][0] * 60 + window['end'][1])
+    for meal, window in MEAL_TIME_WINDOWS.items()
+}
+
 
 # Patterns to detect meal time avoidance requests
 MEAL_AVOID_PATTERNS = [
     r'\bavoid\s+(?:the\s+)?(?:breakfast|lunch|dinner|brunch|snack)\s*(?:time)?\b',
-    r'\b(no|not|skip)\s+(?:the\s+)?(?:breakfast|lunch|dinner|brunch|snack)\b',
+    r'\b(?:no|not|skip)\s+(?:the\s+)?(?:breakfast|lunch|dinner|brunch|snack)\b',
     r'\b(?:during|at)\s+(?:noon|lunchtime|dinnertime|breakfast\s*time)\b',
     r'\boutside\s+(?:of\s+)?(?:breakfast|lunch|dinner)\s*(?:time)?\b',
     r'\b(?:before|after)\s+(?:breakfast|lunch|dinner)\b',
@@ -30,6 +37,9 @@ MEAL_AVOID_PATTERNS = [
     r'\bschedule\s+(?:around|outside)\s+(?:the\s+)?meals?\b',
 ]
 
+# Searched once on the lowered sentence instead of pattern by pattern
+MEAL_AVOID_ANY_REGEX = re.compile("|".join(f"(?:{p})" for p in MEAL_AVOID_PATTERNS))
+
 
 def detect_meal_time_avoidance(sentence: str) -> Tuple[bool, list]:
     """
@@ -41,27 +51,31 @@ def detect_meal_time_avoidance(sentence: str) -> Tuple[bool, list]:
     Returns:
         Tuple of (needs_avoidance, list of meal types to avoid)
     """
-    text = sentence.lower().strip()
+    needs_avoidance, meals_to_avoid = _detect_meal_time_avoidance_normalized(sentence.lower().strip())
+    return needs_avoidance, list(meals_to_avoid)
+
+
+@lru_cache(maxsize=4096)
+def _detect_meal_time_avoidance_normalized(text: str) -> Tuple[bool, tuple]:
+    """Cached body of detect_meal_time_avoidance; ``text`` is already stripped and lowercased."""
     meals_to_avoid = []
     
-    for pattern in MEAL_AVOID_PATTERNS:
-        if re.search(pattern, text):
-            # Check which specific meals are mentioned
-            if 'breakfast' in text:
-                meals_to_avoid.append('breakfast')
-            if 'lunch' in text:
-                meals_to_avoid.append('lunch')
-            if 'dinner' in text:
-                meals_to_avoid.append('dinner')
-            if 'brunch' in text:
-                meals_to_avoid.append('brunch')
-            if 'snack' in text:
-                meals_to_avoid.append('snack')
-            if 'meal' in text and not meals_to_avoid:
-                meals_to_avoid = ['breakfast', 'lunch', 'dinner']
-            break
-    
-    return len(meals_to_avoid) > 0, list(set(meals_to_avoid))
+    if MEAL_AVOID_ANY_REGEX.search(text):
+        # Check which specific meals are mentioned
+        if 'breakfast' in text:
+            meals_to_avoid.append('breakfast')
+        if 'lunch' in text:
+            meals_to_avoid.append('lunch')
+        if 'dinner' in text:
+            meals_to_avoid.append('dinner')
+        if 'brunch' in text:
+            meals_to_avoid.append('brunch')
+        if 'snack' in text:
+            meals_to_avoid.append('snack')
+        if 'meal' in text and not meals_to_avoid:
+            meals_to_avoid = ['breakfast', 'lunch', 'dinner']
+    
+    return len(meals_to_avoid) > 0, tuple(set(meals_to_avoid))
 
 
 def is_time_in_meal_window(dt: datetime, meal: str) -> bool:
@@ -75,21 +89,11 @@ def is_time_in_meal_window(dt: datetime, meal: str) -> bool:
     Returns:
         True if the time is within the meal window
     """
-    if meal not in MEAL_TIME_WINDOWS:
+    if meal not in MEAL_TIME_MINUTES:
         return False
     
-    window = MEAL_TIME_WINDOWS[meal]
-    current_hour = dt.hour
-    current_minute = dt.minute
-    start_hour, start_minute = window['start']
-    end_hour, end_minute = window['end']
-    
-    # Convert to minutes since midnight for comparison
-    current_total = current_hour * 60 + current_minute
-    start_total = start_hour * 60 + start_minute
-    end_total = end_hour * 60 + end_minute
-    
-    return start_total <= current_total < end_total
+    start_total, end_total = MEAL_TIME_MINUTES[meal]
+    return start_total <= dt.hour * 60 + dt.minute < end_total
 
 
 def adjust_time_for_meal_avoidance(dt: datetime, meals_to_avoid: list) -> datetime:
@@ -105,14 +109,15 @@ def adjust_time_for_meal_avoidance(dt: datetime, meals_to_avoid: list) -> dateti
     """
     adjusted_dt = dt
     
-    for meal in meals_to_avoid:
-        if meal in MEAL_TIME_WINDOWS and is_time_in_meal_window(adjusted_dt, meal):
-            window = MEAL_TIME_WINDOWS[meal]
+    # Earliest window first, so a move past one meal is only checked against later ones
+    for meal in sorted((m for m in meals_to_avoid if m in MEAL_TIME_MINUTES), key=MEAL_TIME_MINUTES.get):
+        if is_time_in_meal_window(adjusted_dt, meal):
             # Move to the end of the meal window
-            end_hour, end_minute = window['end']
+            end_hour, end_minute = MEAL_TIME_WINDOWS[meal]['end']
             adjusted_dt = adjusted_dt.replace(hour=end_hour, minute=end_minute, second=0, microsecond=0)
-            # Add a small buffer (15 minutes after meal time)
-            adjusted_dt = adjusted_dt.replace(minute=adjusted_dt.minute + 15)
+            # Add a small buffer (15 minutes after meal time); timedelta carries
+            # into the next hour where replace(minute=...) would raise
+            adjusted_dt += timedelta(minutes=15)
     
     return adjusted_dt
 
@@ -132,36 +137,33 @@ def find_available_slot(base_dt: datetime, duration_minutes: int, meals_to_avoid
     Returns:
         Available datetime or None if no slot found
     """
-    current_dt = base_dt.replace(hour=start_hour, minute=0, second=0, microsecond=0)
-    
-    # If base_dt is earlier than business hours, start from business hours
-    if current_dt < base_dt:
-        current_dt = base_dt
+    # Meal windows to avoid as sorted (start, end) minutes since midnight,
+    # with overlapping windows (e.g. brunch and lunch) merged
+    blocked = []
+    for start, end in sorted(MEAL_TIME_MINUTES[meal] for meal in set(meals_to_avoid) if meal in MEAL_TIME_MINUTES):
+        if blocked and start <= blocked[-1][1]:
+            blocked[-1] = (blocked[-1][0], max(blocked[-1][1], end))
+        else:
+            blocked.append((start, end))
+    
+    day_start = base_dt.replace(hour=0, minute=0, second=0, microsecond=0)
+    # Earliest minute of the first day that is not before base_dt
+    base_minute = base_dt.hour * 60 + base_dt.minute + (1 if base_dt.second or base_dt.microsecond else 0)
     
     # Search for the next 7 days
-    for _ in range(7):
-        # Check each hour in business hours
-        for hour in range(start_hour, end_hour):
-            slot_dt = current_dt.replace(hour=hour, minute=0, second=0, microsecond=0)
-            
-            # Check if slot is during a meal time
-            during_meal = False
-            for meal in meals_to_avoid:
-                if is_time_in_meal_window(slot_dt, meal):
-                    during_meal = True
-                    break
-            
-            if not during_meal:
-                # Check if the meeting would end before business hours
-                end_dt = slot_dt.replace(minute=slot_dt.minute + duration_minutes)
-                if end_dt.hour <= end_hour or (end_dt.hour == end_hour and end_dt.minute == 0):
-                    return slot_dt
-            
-            # Move to next hour
-            current_dt = current_dt.replace(hour=hour + 1)
+    for day in range(7):
+        current = start_hour * 60
+        if day == 0:
+            current = max(current, base_minute)
+        
+        # Jump past every meal window the meeting would overlap
+        for start, end in blocked:
+            if start < current + duration_minutes and current < end:
+                current = end
         
-        # Move to next day
-        current_dt = (current_dt + timedelta(days=1)).replace(hour=start_hour, minute=0)
+        # Check if the meeting would end within business hours
+        if current + duration_minutes <= end_hour * 60:
+            return day_start + timedelta(days=day, minutes=current)
     
     return None
 
@@ -4,6 +4,7 @@ Contains all patterns and keywords for detecting cancel/delete meeting actions.
 """
 
 import re
+from functools import lru_cache
 from typing import List, Dict
 
 
@@ -13,40 +14,41 @@ from typing import List, Dict
 
 CANCEL_PATTERNS = [
     # Direct cancel patterns - cancel verb before meeting
-    r'\b(cancel(?:ing)?|delete|remove|drop|scrap|abort|void|nullify|terminate|stop)\s+(?:the\s+)?(?:meeting|event|appointment|call|sync|chat|message|it|this|that)\b',
+    r'\b(?:cancel(?:ing)?|delete|remove|drop|scrap|abort|void|nullify|terminate|stop)\s+(?:the\s+)?(?:meeting|event|appointment|call|sync|chat|message|it|this|that)\b',
     
     # Reverse order: "meeting cancel" - cancel noun after meeting
     r'\b(?:meeting|event|appointment|call|sync|chat|message)\s+(?:with\s+)?(?:cancel(?:lation)?|deletion|removal|drop|scrap|abort|termination|stop)\b',
     
     # Also match: "meeting with john cancel" - cancel keyword at the end
-    r'\b(?:meeting|event|appointment|call|sync)\s+.*\b(cancel(?:ed|ing|lation)?|delete(?:d|ing)?|remove(?:d|ing)?|drop(?:ped|ping)?|scrap(?:ped|ping)?|abort(?:ed|ing)?|terminate(?:d|ing)?|stop(?:ped|ping)?)\b',
+    # (the gap is bounded so a long sentence can't make each meeting word rescan the rest of it)
+    r'\b(?:meeting|event|appointment|call|sync)\s+.{0,120}\b(?:cancel(?:ed|ing|lation)?|delete(?:d|ing)?|remove(?:d|ing)?|drop(?:ped|ping)?|scrap(?:ped|ping)?|abort(?:ed|ing)?|terminate(?:d|ing)?|stop(?:ped|ping)?)\b',
     
     # Match patterns where user might use extra words like "Please", "I want", etc.
     r'(?:please|kindly|can\s+you|would\s+you)\s+(?:cancel|delete|remove|drop|scrap|abort|terminate|stop)\s+(?:the\s+)?(?:meeting|event|appointment|call|sync|chat|message|it|this|that)\b',
     
     # "Cancel" followed by extra description (e.g., "Cancel the meeting at 2 PM")
-    r'\b(cancel(?:ing)?|delete|remove|drop|scrap|abort|terminate|stop)\s+(?:the\s+)?(?:meeting|event|appointment|call|sync|chat|message)\s+(?:at\s+\d{1,2}\s*(?:AM|PM)?)?\b',
+    r'\b(?:cancel(?:ing)?|delete|remove|drop|scrap|abort|terminate|stop)\s+(?:the\s+)?(?:meeting|event|appointment|call|sync|chat|message)\s+(?:at\s+\d{1,2}\s*(?:am|pm)?)?\b',
     
     # Patterns for phrases with extra details like time (e.g., "Cancel the meeting at 3 PM tomorrow")
-    r'\b(cancel(?:ing)?|delete|remove|drop|scrap|abort|terminate|stop)\s+(?:the\s+)?(?:meeting|event|appointment|call|sync|chat|message)\s+(?:at|on|for)\s+\S+\b',
+    r'\b(?:cancel(?:ing)?|delete|remove|drop|scrap|abort|terminate|stop)\s+(?:the\s+)?(?:meeting|event|appointment|call|sync|chat|message)\s+(?:at|on|for)\s+\S+\b',
     
     # Also match cancel words directly followed by any word (for "remove it", "drop this", etc.)
-    r'\b(cancel|delete|remove|drop|scrap|abort|void|nullify|terminate|stop)\s+(it|this|that|everything|the\s+thing|that\s+event|the\s+meeting)\b',
+    r'\b(?:cancel|delete|remove|drop|scrap|abort|void|nullify|terminate|stop)\s+(?:it|this|that|everything|the\s+thing|that\s+event|the\s+meeting)\b',
     
     # Handle different ordering: "cancel event this" or "cancel this event"
-    r'\b(cancel(?:ing)?|delete|remove|drop|scrap|abort|terminate|stop)\s+(?:this|that|it)\s+(?:meeting|event|appointment|call|sync|chat|message)\b',
+    r'\b(?:cancel(?:ing)?|delete|remove|drop|scrap|abort|terminate|stop)\s+(?:this|that|it)\s+(?:meeting|event|appointment|call|sync|chat|message)\b',
     
     # Match standalone cancel keywords when followed by meeting-related words
-    r'\b(cancel|delete|remove|drop|scrap|abort|terminate|stop)\b\s+(?:meeting|event|appointment|call|sync|message|chat)',
+    r'\b(?:cancel|delete|remove|drop|scrap|abort|terminate|stop)\b\s+(?:meeting|event|appointment|call|sync|message|chat)',
 
     # For more complex expressions with adverbs and modals (e.g., "I really want to cancel the meeting")
-    r'\b(?:I\s+really\s+want\s+to|I\s+would\s+like\s+to|can\s+you)\s+(?:cancel|delete|remove|drop|scrap|abort|terminate|stop)\s+(?:the\s+)?(?:meeting|event|appointment|call|sync|chat|message|it|this|that)\b',
+    r'\b(?:i\s+really\s+want\s+to|i\s+would\s+like\s+to|can\s+you)\s+(?:cancel|delete|remove|drop|scrap|abort|terminate|stop)\s+(?:the\s+)?(?:meeting|event|appointment|call|sync|chat|message|it|this|that)\b',
 
     # Handling more ambiguous cancel phrases: "Cancel this thing"
-    r'\b(cancel|delete|remove|drop|scrap|abort|terminate|stop)\s+(?:this|it|that|thing)\s+(?:thing|event|appointment|meeting)\b',
+    r'\b(?:cancel|delete|remove|drop|scrap|abort|terminate|stop)\s+(?:this|it|that|thing)\s+(?:thing|event|appointment|meeting)\b',
     
     # Handling plural form or related patterns like "cancelling all meetings"
-    r'\b(cancel(?:ing)?|delete|remove|drop|scrap|abort|terminate|stop)\s+all\s+(?:meetings|events|appointments|calls|messages)\b',
+    r'\b(?:cancel(?:ing)?|delete|remove|drop|scrap|abort|terminate|stop)\s+all\s+(?:meetings|events|appointments|calls|messages)\b',
     
     # Handle cancel phrases with modal verbs like "could you", "would you"
     r'\b(?:could\s+you|would\s+you|can\s+you)\s+(?:cancel|delete|remove|drop|scrap|abort|terminate|stop)\s+(?:the\s+)?(?:meeting|event|appointment|call|sync|chat|message|it|this|that)\b',
@@ -58,15 +60,25 @@ CANCEL_PATTERNS = [
     r'\bcancel(?:ed|ing|lation)?\b',
     r'\bdelete[ds]?\b',
     r'\bremove[ds]?\b',
-    r'\bdro(p|ped|ping)\b',
+    r'\bdro(?:p|ped|ping)\b',
     r'\bscrap(?:ped|ping)?\b',
     r'\babort(?:ed|ing)?\b',
     
     # Jumbled word patterns - meeting/event BEFORE cancel keywords
     r'\b(?:project\s+)?(?:meeting|event|appointment|call|sync)\s+(?:with\s+[^\s]+\s+)?(?:cancel|delete|remove|drop|scrap|abort)\b',
-    r'\b(?:meeting|event)\s+.*(?:cancel|delete|remove|drop|scrap|abort)\b',
+    r'\b(?:meeting|event)\s+.{0,120}(?:cancel|delete|remove|drop|scrap|abort)\b',
 ]
 
+# Compiled once at import so the hot paths don't go through re's cache per call
+CANCEL_REGEXES = tuple(re.compile(p, re.IGNORECASE) for p in CANCEL_PATTERNS)
+
+# Searched on lowered text, like CREATE_ANY_REGEX_LOWER
+CANCEL_ANY_REGEX_LOWER = re.compile("|".join(f"(?:{p})" for p in CANCEL_PATTERNS))
+
+# Every cancel pattern and keyword contains one of these stems ('delet' also
+# covers "deletion", 'remov' covers "removal"), so a miss here rules out a cancel
+CANCEL_STEM_REGEX = re.compile(r'cancel|delet|remov|drop|scrap|abort|void|nullif|terminat|stop', re.IGNORECASE)
+
 # Cancel keywords for fuzzy matching
 CANCEL_KEYWORDS = [
     'cancel', 'cancelling', 'canceling', 'cancelled', 'canceled',
@@ -81,6 +93,10 @@ CANCEL_KEYWORDS = [
     'stop', 'stopping', 'stopped'
 ]
 
+# Every keyword as one literal alternation: a single pass over the sentence
+# finds any of them as a substring
+CANCEL_KEYWORD_REGEX = re.compile("|".join(re.escape(keyword.lower()) for keyword in CANCEL_KEYWORDS))
+
 # Cancel keyword set for fast lookup
 CANCEL_KW_SET = {
     'cancel', 'cancelling', 'canceling', 'cancelled', 'canceled',
@@ -95,6 +111,13 @@ CANCEL_KW_SET = {
     'stop', 'stopping', 'stopped'
 }
 
+# Meeting-related words that let a bare cancel keyword count as a cancel
+CANCEL_MEETING_WORDS = frozenset({
+    'meeting', 'meetings', 'event', 'events', 'call', 'calls',
+    'appointment', 'appointments', 'standup', 'standups', 'session', 'sessions',
+    'sync', 'chat', 'chats', 'hangout', 'google meet', 'zoom'
+})
+
 
 def is_cancel_pattern(sentence: str) -> bool:
     """
@@ -106,7 +129,7 @@ def is_cancel_pattern(sentence: str) -> bool:
     Returns:
         True if the sentence matches any cancel pattern
     """
-    return any(re.search(pattern, sentence, re.IGNORECASE) for pattern in CANCEL_PATTERNS)
+    return CANCEL_ANY_REGEX_LOWER.search(sentence.lower()) is not None
 
 
 def has_cancel_keyword(sentence: str) -> bool:
@@ -119,8 +142,7 @@ def has_cancel_keyword(sentence: str) -> bool:
     Returns:
         True if the sentence contains any cancel keyword
     """
-    text_lower = sentence.lower()
-    return any(keyword.lower() in text_lower for keyword in CANCEL_KEYWORDS)
+    return CANCEL_KEYWORD_REGEX.search(sentence.lower()) is not None
 
 
 def extract_cancel_details(sentence: str) -> Dict[str, any]:
@@ -133,6 +155,13 @@ def extract_cancel_details(sentence: str) -> Dict[str, any]:
     Returns:
         Dictionary with cancel action details
     """
+    # The cached dict only holds scalars, so a shallow copy keeps callers independent
+    return dict(_extract_cancel_details_cached(sentence))
+
+
+@lru_cache(maxsize=4096)
+def _extract_cancel_details_cached(sentence: str) -> Dict[str, any]:
+    """Cached body of extract_cancel_details; the returned dict must not be mutated."""
     result = {
         'is_cancel': False,
         'action': None,
@@ -142,29 +171,27 @@ def extract_cancel_details(sentence: str) -> Dict[str, any]:
     }
     
     text_lower = sentence.lower()
-    tokens = set(text_lower.split())
     
-    # Meeting-related words
-    meeting_words = {
-        'meeting', 'meetings', 'event', 'events', 'call', 'calls',
-        'appointment', 'appointments', 'standup', 'standups', 'session', 'sessions',
-        'sync', 'chat', 'chats', 'hangout', 'google meet', 'zoom'
-    }
+    result['has_meeting_word'] = not CANCEL_MEETING_WORDS.isdisjoint(text_lower.split())
     
-    result['has_meeting_word'] = bool(tokens & meeting_words)
+    # Most sentences carry no cancel stem at all; skip the pattern scan for them
+    if not CANCEL_STEM_REGEX.search(sentence):
+        return result
     
-    # Check patterns
-    for pattern in CANCEL_PATTERNS:
-        match = re.search(pattern, sentence, re.IGNORECASE)
-        if match:
-            result['is_cancel'] = True
-            result['action'] = 'cancel'
-            result['intent'] = 'cancel_meeting'
-            result['matched_pattern'] = pattern
-            return result
+    # Check patterns (a miss on the combined regex rules them all out in one scan)
+    if CANCEL_ANY_REGEX_LOWER.search(text_lower):
+        for regex in CANCEL_REGEXES:
+            match = regex.search(sentence)
+            if match:
+                result['is_cancel'] = True
+                result['action'] = 'cancel'
+                result['intent'] = 'cancel_meeting'
+                result['matched_pattern'] = regex.pattern
+                return result
     
     # Check for cancel keywords if no pattern matched
-    if has_cancel_keyword(sentence) and result['has_meeting_word']:
+    # (the keyword regex runs on the already lowered text, and only when needed)
+    if result['has_meeting_word'] and CANCEL_KEYWORD_REGEX.search(text_lower):
         result['is_cancel'] = True
         result['action'] = 'cancel'
         result['intent'] = 'cancel_meeting'
@@ -4,7 +4,8 @@ Handles jumbled word order and natural language variations.
 """
 
 import re
-from typing import Dict, Set
+from functools import lru_cache
+from typing import Dict, Optional, Set, Tuple
 
 
 # =============================================================================
@@ -63,10 +64,24 @@ NOT_CREATE_KEYWORDS: Set[str] = {
 }
 
 
+# Every keyword mapped to its group so one lookup per word classifies it
+# (the three groups are disjoint)
+WORD_ROLES: Dict[str, str] = {
+    **{word: 'blocked' for word in NOT_CREATE_KEYWORDS},
+    **{word: 'create' for word in CREATE_KEYWORDS},
+    **{word: 'meeting' for word in MEETING_WORDS},
+}
+
+
 # =============================================================================
 # TEXT NORMALIZATION
 # =============================================================================
 
+# Compiled once at import so normalize_text doesn't go through re's cache per call
+PUNCTUATION_REGEX = re.compile(r'[^\w\s:/-]')  # keep time/date characters
+WHITESPACE_REGEX = re.compile(r'\s+')
+
+
 def normalize_text(text: str) -> str:
     """
     Normalize input text:
@@ -75,18 +90,11 @@ def normalize_text(text: str) -> str:
     - Remove punctuation (except time/date related symbols)
     """
     text = text.lower()
-    text = re.sub(r'[^\w\s:/-]', ' ', text)  # keep time/date characters
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = PUNCTUATION_REGEX.sub(' ', text)
+    text = WHITESPACE_REGEX.sub(' ', text).strip()
     return text
 
 
-def tokenize(text: str) -> Set[str]:
-    """
-    Tokenize text into unique words.
-    """
-    return set(re.findall(r'\b\w+\b', text))
-
-
 # =============================================================================
 # MAIN LOGIC
 # =============================================================================
@@ -97,6 +105,29 @@ def extract_create_details(sentence: str) -> Dict[str, any]:
     Handles jumbled and free-form input.
     """
 
+    # 1️⃣ Normalize text (sentences that normalize alike share one cache entry)
+    is_create, action, intent, confidence, signals = _extract_create_details_normalized(normalize_text(sentence or ''))
+    # Built fresh on every call so callers can modify the result
+    return {
+        'is_create': is_create,
+        'action': action,
+        'intent': intent,
+        'confidence': confidence,
+        'signals': list(signals)
+    }
+
+
+@lru_cache(maxsize=4096)
+def _extract_create_details_normalized(text: str) -> Tuple[bool, Optional[str], Optional[str], float, Tuple[str, ...]]:
+    """Cached extract_create_details as an immutable (is_create, action, intent, confidence, signals) tuple."""
+    details = _detect_create_details(text)
+    return (details['is_create'], details['action'], details['intent'],
+            details['confidence'], tuple(details['signals']))
+
+
+def _detect_create_details(text: str) -> Dict[str, any]:
+    """Uncached body of extract_create_details; ``text`` is already normalized."""
+
     result = {
         'is_create': False,
         'action': None,
@@ -105,39 +136,35 @@ def extract_create_details(sentence: str) -> Dict[str, any]:
         'signals': []
     }
 
-    if not sentence or not sentence.strip():
+    if not text:
         return result
 
-    # 1️⃣ Normalize text
-    text = normalize_text(sentence)
-
     # 2️⃣ Split into words (ORDER DOES NOT MATTER)
     words = text.split()
 
-    # 3️⃣ Convert to set for fast lookup
-    word_set = set(words)
-
-    # 4️⃣ Check NEGATIVE keywords first (block)
+    # 4️⃣ Classify each word in one pass: any NEGATIVE keyword blocks, and the
+    # first CREATE and first MEETING keyword are remembered
+    create_word = None
+    meeting_word = None
     for word in words:
-        if word in NOT_CREATE_KEYWORDS:
+        role = WORD_ROLES.get(word)
+        if role == 'blocked':
             result['signals'].append(f"blocked_by:{word}")
             return result
+        if role == 'create' and create_word is None:
+            create_word = word
+        elif role == 'meeting' and meeting_word is None:
+            meeting_word = word
 
     # 5️⃣ Check CREATE keywords
-    create_found = False
-    for word in words:
-        if word in CREATE_KEYWORDS:
-            create_found = True
-            result['signals'].append(f"create_word:{word}")
-            break
+    create_found = create_word is not None
+    if create_found:
+        result['signals'].append(f"create_word:{create_word}")
 
     # 6️⃣ Check MEETING keywords
-    meeting_found = False
-    for word in words:
-        if word in MEETING_WORDS:
-            meeting_found = True
-            result['signals'].append(f"meeting_word:{word}")
-            break
+    meeting_found = meeting_word is not None
+    if meeting_found:
+        result['signals'].append(f"meeting_word:{meeting_word}")
 
     # 7️⃣ Decision Logic
     if create_found and meeting_found:
@@ -148,7 +175,7 @@ def extract_create_details(sentence: str) -> Dict[str, any]:
         return result
 
     # 8️⃣ Fallback — meeting + with pattern
-    if meeting_found and "with" in word_set:
+    if meeting_found and "with" in words:
         result['is_create'] = True
         result['action'] = 'create'
         result['intent'] = 'schedule_meeting'
@@ -181,10 +208,15 @@ def is_create_intent(sentence: str) -> bool:
 # =============================================================================
 
 CREATE_PATTERNS = [
-    r'\b(create|make|book|schedule|arrange|organize|setup|set up|fix|block|have|host|plan)\s+(?:a|an|the|my|our)?\s*(?:meeting|event|appointment|call|sync|chat|standup|session)\b',
-    r'\b(create|make|book|schedule|arrange|organize|setup|set up|fix|block|have|host|plan)\s+(?:a|an)?\s*(?:meeting|event|appointment|call|sync|chat|standup|session)\s+(?:with|at|on|for|tomorrow|today|monday|tuesday|wednesday|thursday|friday|saturday|sunday|week|day|time)\b',
-    r'\bschedule\b',
-    r'\bbook\b',
-    r'\barrange\b',
-    r'\borganize\b',
+    # verb + optional determiner + meeting noun; this also covers the longer
+    # "... meeting with/at/on ..." form, which can only match where this does
+    r'\b(?:create|make|book|schedule|arrange|organize|setup|set up|fix|block|have|host|plan)\s+(?:a|an|the|my|our)?\s*(?:meeting|event|appointment|call|sync|chat|standup|session)\b',
+    # verbs that signal a create on their own
+    r'\b(?:schedule|book|arrange|organize)\b',
 ]
+
+# All alternatives folded into one regex: a single scan answers "does any match?"
+# No re.IGNORECASE: callers pass lowercased text (the pattern literals are all
+# lowercase), which skips sre's per-character case folding
+CREATE_ANY_REGEX_LOWER = re.compile("|".join(f"(?:{p})" for p in CREATE_PATTERNS))
+
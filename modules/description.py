@@ -9,6 +9,38 @@ from typing import Optional, Dict, Any
 from modules.location import extract_meeting_location, format_location_for_print
 
 
+# Patterns for description extraction, compiled once at import
+DESCRIPTION_REGEXES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\babout\s+(.{3,})',
+    r'\bregarding\s+(.{3,})',
+    r'\bre\s+(.{3,})',  # Handle "re term sheet" pattern
+    r'\btopic\s+(.{3,})',
+    r'\bfor\s+(?:the\s+)?(?:discussion|review|update|plan)\s+(?:of\s+)?(.{3,})',
+    r'\bon\s+(?:the\s+)?(?:topic|subject)\s+(?:of\s+)?(.{3,})',
+    r'\bto\s+(?:discuss|talk|review|plan)\s+(.{3,})',
+))
+DESCRIPTION_TRAILING_REGEX = re.compile(
+    r'\s+(?:at|on|tomorrow|today|with|for|next|this|week|monday|tuesday|wednesday|thursday|friday|saturday|sunday|morning|afternoon|evening|am|pm)\s*$',
+    re.IGNORECASE
+)
+RE_PREFIX_REGEX = re.compile(r'\s+re:\s*', re.IGNORECASE)
+WHITESPACE_REGEX = re.compile(r'\s+')
+
+# Agenda patterns, compiled once at import
+AGENDA_REGEXES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\bagenda\s+(.{3,})',
+    r'\btopics?\s+(.{3,})',
+    r'\bdiscuss\s+(.{3,})',
+    r'\btalk\s+about\s+(.{3,})',
+    r'\bagenda:\s+(.{3,})',
+    r'\btopic:\s+(.{3,})',
+))
+AGENDA_TRAILING_REGEX = re.compile(
+    r'\s+(?:at|on|tomorrow|today|with|for|next|this|week|monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s*$',
+    re.IGNORECASE
+)
+
+
 def extract_meeting_description(sentence: str) -> str:
     """
     Extract meeting description from natural language sentence.
@@ -21,32 +53,17 @@ def extract_meeting_description(sentence: str) -> str:
     """
     text = sentence.lower().strip()
     
-    # Patterns for description extraction
-    desc_patterns = [
-        r'\babout\s+(.{3,})',
-        r'\bregarding\s+(.{3,})',
-        r'\bre\s+(.{3,})',  # Handle "re term sheet" pattern
-        r'\btopic\s+(.{3,})',
-        r'\bfor\s+(?:the\s+)?(?:discussion|review|update|plan)\s+(?:of\s+)?(.{3,})',
-        r'\bon\s+(?:the\s+)?(?:topic|subject)\s+(?:of\s+)?(.{3,})',
-        r'\bto\s+(?:discuss|talk|review|plan)\s+(.{3,})',
-    ]
-    
-    for pattern in desc_patterns:
-        try:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                desc = match.group(1).strip()
-                # Clean up the description - remove trailing keywords
-                trailing_pattern = r'\s+(?:at|on|tomorrow|today|with|for|next|this|week|monday|tuesday|wednesday|thursday|friday|saturday|sunday|morning|afternoon|evening|am|pm)\s*$'
-                desc = re.sub(trailing_pattern, '', desc, flags=re.IGNORECASE)
-                desc = re.sub(r'\s+re:\s*', ' ', desc, flags=re.IGNORECASE)
-                desc = re.sub(r'\s+', ' ', desc)
-                desc = desc.strip('.,;:!?')
-                if len(desc) > 2:
-                    return desc.capitalize()
-        except re.error:
-            continue
+    for regex in DESCRIPTION_REGEXES:
+        match = regex.search(text)
+        if match:
+            desc = match.group(1).strip()
+            # Clean up the description - remove trailing keywords
+            desc = DESCRIPTION_TRAILING_REGEX.sub('', desc)
+            desc = RE_PREFIX_REGEX.sub(' ', desc)
+            desc = WHITESPACE_REGEX.sub(' ', desc)
+            desc = desc.strip('.,;:!?')
+            if len(desc) > 2:
+                return desc.capitalize()
     
     return ''
 
@@ -63,28 +80,14 @@ def extract_meeting_agenda(sentence: str) -> str:
     """
     text = sentence.lower().strip()
     
-    # Agenda patterns
-    agenda_patterns = [
-        r'\bagenda\s+(.{3,})',
-        r'\btopics?\s+(.{3,})',
-        r'\bdiscuss\s+(.{3,})',
-        r'\btalk\s+about\s+(.{3,})',
-        r'\bagenda:\s+(.{3,})',
-        r'\btopic:\s+(.{3,})',
-    ]
-    
-    for pattern in agenda_patterns:
-        try:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                agenda = match.group(1).strip()
-                trailing_pattern = r'\s+(?:at|on|tomorrow|today|with|for|next|this|week|monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s*$'
-                agenda = re.sub(trailing_pattern, '', agenda, flags=re.IGNORECASE)
-                agenda = agenda.strip('.,;:!?')
-                if len(agenda) > 2:
-                    return agenda.capitalize()
-        except re.error:
-            continue
+    for regex in AGENDA_REGEXES:
+        match = regex.search(text)
+        if match:
+            agenda = match.group(1).strip()
+            agenda = AGENDA_TRAILING_REGEX.sub('', agenda)
+            agenda = agenda.strip('.,;:!?')
+            if len(agenda) > 2:
+                return agenda.capitalize()
     
     return ''
 
@@ -84,8 +84,8 @@ def find_matching_events(service, sentence, email_book, extracted_date=None, att
         cleaned_name = ' '.join(cleaned_parts)
         
         if cleaned_name:
-            # Split by comma or & to get individual names
-            name_parts = re.split(r'\s*[,&]\s*', cleaned_name)
+            # Split by comma or & to get individual names (each part is stripped below)
+            name_parts = cleaned_name.replace('&', ',').split(',')
             for name in name_parts:
                 name = name.strip()
                 if not name or name in ['and', '&', ',']:
@@ -149,11 +149,10 @@ def find_matching_events(service, sentence, email_book, extracted_date=None, att
                 break  # Take the first valid word from the end
         
         if potential_names:
+            # Already lowercased, which is the form search_terms are matched in
             potential_name = potential_names[0]
-            # Capitalize first letter for consistency
-            potential_name = potential_name.title()
-            if potential_name.lower() not in [t.lower() for t in search_terms]:
-                search_terms.append(potential_name.lower())
+            if potential_name not in [t.lower() for t in search_terms]:
+                search_terms.append(potential_name)
                 print(f"DEBUG: Extracted name '{potential_name}' from '[name] delete' pattern")
     
     # Get meeting details for additional name extraction
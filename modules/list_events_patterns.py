@@ -419,16 +419,16 @@ LIST_EVENTS_PATTERNS = [
 # Combined pattern for detect_action in routes
 LIST_PATTERNS = [
     # List events patterns
-    r'\b(list|show|view|display|get|check|fetch|retrieve|see)\s+(all\s+)?(my\s+)?(upcoming\s+)?(the\s+)?(events|meetings|appointments|schedule|calendar)\b',
-    r'\b(list|show|view|display|get|check|fetch|retrieve|see)\s+(all\s+)?(my\s+)?(upcoming\s+)?(events|meetings|appointments|schedule)\s+(for|on|this|next|today|tomorrow)\b',
-    r'\bwhat\s+(events|meetings|appointments|schedule)\b',
-    r'\bdo\s+I\s+(have|get)\s+(any\s+)?(upcoming\s+)?(events|meetings|appointments)\b',
-    r'\bshow\s+me\s+(my\s+)?(upcoming\s+)?(events|meetings)\b',
-    r'\blist\s+my\s+(upcoming\s+)?(events|meetings|schedule)\b',
-    r'\bevents\s+for\s+(today|tomorrow|this\s+week|next\s+week)\b',
-    r'\bmeetings\s+(today|tomorrow|this\s+week|next\s+week)\b',
-    r'\bupcoming\s+(events|meetings|appointments)\b',
-    r'\bmy\s+(events|meetings|schedule|calendar)\b',
+    r'\b(?:list|show|view|display|get|check|fetch|retrieve|see)\s+(?:all\s+)?(?:my\s+)?(?:upcoming\s+)?(?:the\s+)?(?:events|meetings|appointments|schedule|calendar)\b',
+    r'\b(?:list|show|view|display|get|check|fetch|retrieve|see)\s+(?:all\s+)?(?:my\s+)?(?:upcoming\s+)?(?:events|meetings|appointments|schedule)\s+(?:for|on|this|next|today|tomorrow)\b',
+    r'\bwhat\s+(?:events|meetings|appointments|schedule)\b',
+    r'\bdo\s+i\s+(?:have|get)\s+(?:any\s+)?(?:upcoming\s+)?(?:events|meetings|appointments)\b',
+    r'\bshow\s+me\s+(?:my\s+)?(?:upcoming\s+)?(?:events|meetings)\b',
+    r'\blist\s+my\s+(?:upcoming\s+)?(?:events|meetings|schedule)\b',
+    r'\bevents\s+for\s+(?:today|tomorrow|this\s+week|next\s+week)\b',
+    r'\bmeetings\s+(?:today|tomorrow|this\s+week|next\s+week)\b',
+    r'\bupcoming\s+(?:events|meetings|appointments)\b',
+    r'\bmy\s+(?:events|meetings|schedule|calendar)\b',
     # Short patterns for 6 or less words
     r'\blist\s+events\b',
     r'\bshow\s+events\b',
@@ -444,8 +444,11 @@ LIST_PATTERNS = [
     r'\bthis\s+week\b',
     r'\bnext\s+week\b',
     # Reversed order patterns (noun then verb) - "event list" instead of "list events"
-    r'\b(event|events|meeting|meetings|appointment|appointments)\s+(list|show|view|display|get|check|fetch|retrieve|see)\b',
-    r'\b(event|events)\s+list\b',
-    r'\b(meeting|meetings)\s+list\b',
-    r'\b(events|meetings)\s+(list|show|view)\b',
+    r'\b(?:event|events|meeting|meetings|appointment|appointments)\s+(?:list|show|view|display|get|check|fetch|retrieve|see)\b',
+    r'\b(?:event|events)\s+list\b',
+    r'\b(?:meeting|meetings)\s+list\b',
+    r'\b(?:events|meetings)\s+(?:list|show|view)\b',
 ]
+
+# detect_action searches this on the lowered sentence (see CREATE_ANY_REGEX_LOWER)
+LIST_ANY_REGEX_LOWER = re.compile("|".join(f"(?:{p})" for p in LIST_PATTERNS))
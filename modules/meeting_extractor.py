@@ -11,7 +11,7 @@ from modules.summary import extract_meeting_title
 from modules.description import extract_meeting_description, extract_meeting_agenda
 from modules.duration import extract_meeting_duration
 from modules.location import extract_meeting_location
-from modules.attendees import extract_attendees, load_email_book
+from modules.attendees import extract_attendees
 from modules.date_utils import extract_date, is_date_ambiguous, format_past_date_error
 from modules.time_utils import extract_time
 from modules.action_utils import extract_action_intent
@@ -37,10 +37,6 @@ def extract_meeting_details(
         Dictionary with all meeting details. 
         If date is past, returns {'error': 'past_date', 'details': error_info}
     """
-    # Load email book if not provided
-    if email_book is None:
-        email_book = load_email_book()
-    
     # Get current datetime for base
     now = base_dt if base_dt is not None else datetime.now(timezone(timedelta(hours=5, minutes=30)))
     
@@ -50,6 +46,8 @@ def extract_meeting_details(
     agenda = extract_meeting_agenda(sentence)
     duration_min, _ = extract_meeting_duration(sentence)
     location_info = extract_meeting_location(sentence)
+    # With no email_book (or attendees.EMAIL_BOOK itself, which is what
+    # services.calendar.load_email_book returns) the prebuilt index is reused
     attendees = extract_attendees(sentence, email_book)
     
     # Get meeting link from location_info (not calling extract_meeting_link separately)
@@ -60,6 +60,21 @@ def is_update_sentence(sentence: str) -> bool:
     return False
 
 
+# Words clean_title drops: day names, date/time words and the fragments
+# partial matches leave behind (like 'o' from 'on', 'nex' from 'next')
+TITLE_SKIP_WORDS = frozenset({
+    'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday',
+    'tomorrow', 'today', 'next', 'this', 'on', 'at', 'in', 'afternoon', 'morning', 'evening', 'noon',
+    'o', 'nex', 'thi', 'apr', 'mar', 'may', 'feb',
+})
+
+# Time tokens such as "9:30am" or "10:00"
+TITLE_TIME_REGEX = re.compile(r'\d{1,2}:\d{2}(?:am|pm)?')
+
+# Trailing preposition left over once the skipped words are gone
+TITLE_TRAILING_PREPOSITION_REGEX = re.compile(r'\s+(?:on|at|in|for|to|with)$', re.IGNORECASE)
+
+
 def clean_title(title: str) -> str:
     """
     Clean up a title by removing trailing date/time words.
@@ -77,31 +92,17 @@ def clean_title(title: str) -> str:
     cleaned_words = []
     
     for word in words:
-        # Skip words that match date/time patterns
-        skip = False
+        # Skip date/time words and time patterns (like "9:30am", "10am", etc.)
         word_lower = word.lower()
-        
-        # Check for day names
-        if word_lower in ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']:
-            skip = True
-        # Check for simple words
-        elif word_lower in ['tomorrow', 'today', 'next', 'this', 'on', 'at', 'in', 'afternoon', 'morning', 'evening', 'noon']:
-            skip = True
-        # Check for partial words (like 'o' from 'on', 'nex' from 'next')
-        elif word_lower in ['o', 'nex', 'thi', 'at', 'in', 'apr', 'mar', 'may', 'feb']:
-            skip = True
-        # Check for time patterns (like "9:30am", "10am", etc.)
-        elif re.match(r'\d{1,2}:\d{2}(?:am|pm)?', word_lower):
-            skip = True
-        
-        if not skip:
-            cleaned_words.append(word)
+        if word_lower in TITLE_SKIP_WORDS or TITLE_TIME_REGEX.match(word_lower):
+            continue
+        cleaned_words.append(word)
     
     # Reconstruct title
     cleaned = ' '.join(cleaned_words)
     
     # Additional cleanup: remove trailing prepositions
-    cleaned = re.sub(r'\s+(?:on|at|in|for|to|with)$', '', cleaned, flags=re.IGNORECASE)
+    cleaned = TITLE_TRAILING_PREPOSITION_REGEX.sub('', cleaned)
     
     return cleaned.strip()
 
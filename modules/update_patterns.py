@@ -21,15 +21,15 @@ UPDATE_PATTERNS = [
     r'alter\s+.*meeting',
     r'adjust\s+.*meeting',
     r'amend\s+.*meeting',
-    r'replace\s+.*(?:Google\s+Meet|Google Meet|meet\.google|gmeet|zoom|video\s+call|link|location|room)',
+    r'replace\s+.*(?:google\s+meet|google meet|meet\.google|gmeet|zoom|video\s+call|link|location|room)',
     r'(?:change|extend|shorten|increase|decrease)\s+.*(?:duration|length|time)',
     r'from\s+\d+\s*(?:minute|hour|min|hr)s?\s+to\s+\d+\s*(?:minute|hour|min|hr)s?',
     # Patterns with prepositions
-    r'\bto\s+(update|change|modify|edit|revise|alter|adjust|amend|replace)\b',
-    r'\b(update|change|modify|edit|revise|alter|adjust|amend|replace)\s+(a|the|my|our|this|that|it|meeting|event|appointment|call)',
+    r'\bto\s+(?:update|change|modify|edit|revise|alter|adjust|amend|replace)\b',
+    r'\b(?:update|change|modify|edit|revise|alter|adjust|amend|replace)\s+(?:a|the|my|our|this|that|it|meeting|event|appointment|call)',
     # Patterns with meeting BEFORE action (for sentences like "meeting update...")
-    r'\bmeeting\s+(update|change|modify|edit|revise|alter|adjust|amend|replace)\b',
-    r'\bproject\s+meeting\s+(update|change|modify|edit|revise|alter|adjust|amend|replace)\b',
+    r'\bmeeting\s+(?:update|change|modify|edit|revise|alter|adjust|amend|replace)\b',
+    r'\bproject\s+meeting\s+(?:update|change|modify|edit|revise|alter|adjust|amend|replace)\b',
 ]
 
 # =============================================================================
@@ -45,12 +45,20 @@ RESCHEDULE_PATTERNS = [
     r'push\s+.*meeting',
     r'bring\s+forward',
     # Also match reschedule keywords directly (for "push it", "move this", etc.)
-    r'\b(postpone|push|move|shift)\s+(it|this|that|back)',
-    r'\b(reschedule|move|shift|postpone|push)\s+(a|the|my|our|this|that|it|meeting|event|appointment|call|sync)',
+    r'\b(?:postpone|push|move|shift)\s+(?:it|this|that|back)',
+    r'\b(?:reschedule|move|shift|postpone|push)\s+(?:a|the|my|our|this|that|it|meeting|event|appointment|call|sync)',
     # Match standalone reschedule keywords followed by time/date indicators
-    r'\b(postpone|push|move|shift)\s+.*(?:to|by|from)\s+\d',
+    r'\b(?:postpone|push|move|shift)\s+.*(?:to|by|from)\s+\d',
 ]
 
+# Compiled once at import so the hot paths don't go through re's cache per call
+UPDATE_REGEXES = tuple(re.compile(p, re.IGNORECASE) for p in UPDATE_PATTERNS)
+RESCHEDULE_REGEXES = tuple(re.compile(p, re.IGNORECASE) for p in RESCHEDULE_PATTERNS)
+
+# One alternation per list, searched on lowered text (see CREATE_ANY_REGEX_LOWER)
+UPDATE_ANY_REGEX_LOWER = re.compile("|".join(f"(?:{p})" for p in UPDATE_PATTERNS))
+RESCHEDULE_ANY_REGEX_LOWER = re.compile("|".join(f"(?:{p})" for p in RESCHEDULE_PATTERNS))
+
 # Update keywords for fuzzy matching
 UPDATE_KEYWORDS = [
     'update', 'updating', 'updated',
@@ -75,6 +83,11 @@ RESCHEDULE_KEYWORDS = [
     'bring', 'forward'
 ]
 
+# Every keyword as one literal alternation: a single pass over the sentence
+# finds any of them as a substring
+UPDATE_KEYWORD_REGEX = re.compile("|".join(re.escape(keyword.lower()) for keyword in UPDATE_KEYWORDS))
+RESCHEDULE_KEYWORD_REGEX = re.compile("|".join(re.escape(keyword.lower()) for keyword in RESCHEDULE_KEYWORDS))
+
 # Combined update/reschedule keyword set
 UPDATE_RESCHEDULE_KW_SET = {
     'update', 'updating', 'updated',
@@ -106,7 +119,7 @@ def is_update_pattern(sentence: str) -> bool:
     Returns:
         True if the sentence matches any update pattern
     """
-    return any(re.search(pattern, sentence, re.IGNORECASE) for pattern in UPDATE_PATTERNS)
+    return UPDATE_ANY_REGEX_LOWER.search(sentence.lower()) is not None
 
 
 def is_reschedule_pattern(sentence: str) -> bool:
@@ -119,7 +132,7 @@ def is_reschedule_pattern(sentence: str) -> bool:
     Returns:
         True if the sentence matches any reschedule pattern
     """
-    return any(re.search(pattern, sentence, re.IGNORECASE) for pattern in RESCHEDULE_PATTERNS)
+    return RESCHEDULE_ANY_REGEX_LOWER.search(sentence.lower()) is not None
 
 
 def has_update_keyword(sentence: str) -> bool:
@@ -132,8 +145,7 @@ def has_update_keyword(sentence: str) -> bool:
     Returns:
         True if the sentence contains any update keyword
     """
-    text_lower = sentence.lower()
-    return any(keyword.lower() in text_lower for keyword in UPDATE_KEYWORDS)
+    return UPDATE_KEYWORD_REGEX.search(sentence.lower()) is not None
 
 
 def has_reschedule_keyword(sentence: str) -> bool:
@@ -146,8 +158,7 @@ def has_reschedule_keyword(sentence: str) -> bool:
     Returns:
         True if the sentence contains any reschedule keyword
     """
-    text_lower = sentence.lower()
-    return any(keyword.lower() in text_lower for keyword in RESCHEDULE_KEYWORDS)
+    return RESCHEDULE_KEYWORD_REGEX.search(sentence.lower()) is not None
 
 
 def has_update_or_reschedule_action(text: str) -> bool:
@@ -194,25 +205,27 @@ def extract_update_details(sentence: str) -> Dict[str, any]:
     
     result['has_meeting_word'] = bool(tokens & meeting_words)
     
-    # Check reschedule patterns first
-    for pattern in RESCHEDULE_PATTERNS:
-        match = re.search(pattern, sentence, re.IGNORECASE)
-        if match:
-            result['is_reschedule'] = True
-            result['action'] = 'update'
-            result['intent'] = 'update_meeting'
-            result['matched_pattern'] = pattern
-            return result
+    # Check reschedule patterns first (a miss on the combined regex rules them all out in one scan)
+    if RESCHEDULE_ANY_REGEX_LOWER.search(text_lower):
+        for regex in RESCHEDULE_REGEXES:
+            match = regex.search(sentence)
+            if match:
+                result['is_reschedule'] = True
+                result['action'] = 'update'
+                result['intent'] = 'update_meeting'
+                result['matched_pattern'] = regex.pattern
+                return result
     
     # Check update patterns
-    for pattern in UPDATE_PATTERNS:
-        match = re.search(pattern, sentence, re.IGNORECASE)
-        if match:
-            result['is_update'] = True
-            result['action'] = 'update'
-            result['intent'] = 'update_meeting'
-            result['matched_pattern'] = pattern
-            return result
+    if UPDATE_ANY_REGEX_LOWER.search(text_lower):
+        for regex in UPDATE_REGEXES:
+            match = regex.search(sentence)
+            if match:
+                result['is_update'] = True
+                result['action'] = 'update'
+                result['intent'] = 'update_meeting'
+                result['matched_pattern'] = regex.pattern
+                return result
     
     # Check for reschedule keywords if no pattern matched
     if has_reschedule_keyword(sentence) and result['has_meeting_word']:
@@ -8,6 +8,11 @@ import os
 import json
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
 
 # Token file path for checking authentication
 TOKEN_FILE = os.path.join(os.path.dirname(__file__), '..', 'config', 'token.json')
@@ -64,6 +69,9 @@ def load_chats():
     if not os.path.exists(CHATS_FILE):
         return {"chats": {}}
     try:
+        if orjson is not None:
+            with open(CHATS_FILE, 'rb') as f:
+                return orjson.loads(f.read())
         with open(CHATS_FILE, 'r', encoding='utf-8') as f:
             return json.load(f)
     except (json.JSONDecodeError, IOError):
@@ -73,8 +81,13 @@ def load_chats():
 def save_chats(data):
     """Save chats to JSON file."""
     os.makedirs(os.path.dirname(CHATS_FILE), exist_ok=True)
-    with open(CHATS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        # orjson writes UTF-8 without escaping, like ensure_ascii=False below
+        with open(CHATS_FILE, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(CHATS_FILE, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
 
 
 @chats_bp.route('/api/chats', methods=['GET'])
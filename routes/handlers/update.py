@@ -10,7 +10,7 @@ import re
 
 from services.calendar import load_email_book, find_matching_events, update_calendar_event
 from modules.summary import extract_meeting_title, is_update_sentence
-from modules.meeting_extractor import extract_meeting_title, extract_attendees, load_email_book as load_book
+from modules.meeting_extractor import extract_meeting_title, extract_attendees
 from modules.date_utils import extract_date
 from modules.time_utils import handle_time_clarification_logic
 from modules.action_utils import extract_action_intent
@@ -20,7 +20,7 @@ from ..utils import build_event_resource
 def extract_update_details(sentence: str, email_book: list = None) -> dict:
     """Extract update-specific details from sentence."""
     if email_book is None:
-        email_book = load_book()
+        email_book = load_email_book()
     
     sentence_lower = sentence.lower()
     
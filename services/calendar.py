@@ -19,13 +19,17 @@ from modules.drive_utils import upload_to_drive
 # Import Event Matching module
 from modules.event_matching import find_matching_events
 
+# Attendee extraction owns the parsed email book and teams
+from modules import attendees
+
 
 # Import scopes from auth service (unified with Calendar and Drive)
 from services.auth import SCOPES as CALENDAR_SCOPES
 
-# Path to token and credentials
+# Paths to token, credentials and config files
 TOKEN_FILE = os.path.join(os.path.dirname(__file__), '..', 'config', 'token.json')
 CREDS_FILE = os.path.join(os.path.dirname(__file__), '..', 'config', 'credentials.json')
+API_KEY_FILE = os.path.join(os.path.dirname(__file__), '..', 'config', 'api_key.json')
 
 
 def get_calendar_service():
@@ -54,21 +58,26 @@ def get_calendar_service():
 
 
 def load_email_book():
-    """Load email book from config/email.json."""
-    email_file = os.path.join(os.path.dirname(__file__), '..', 'config', 'email.json')
-    if not os.path.exists(email_file):
-        return []
-    with open(email_file, 'r') as f:
-        return json.load(f)
+    """
+    Load email book from config/email.json.
+    
+    Returns the book modules.attendees parsed at import, so passing it to
+    extract_attendees reuses its prebuilt name index. It is shared between
+    callers, so treat it as read-only; call modules.attendees.reload_config()
+    after editing the file.
+    """
+    return attendees.EMAIL_BOOK
 
 
 def load_teams():
-    """Load teams from config/teams.json."""
-    teams_file = os.path.join(os.path.dirname(__file__), '..', 'config', 'teams.json')
-    if not os.path.exists(teams_file):
-        return {}
-    with open(teams_file, 'r') as f:
-        return json.load(f)
+    """
+    Load teams from config/teams.json.
+    
+    Wraps the teams table modules.attendees parsed at import, in the
+    {'teams': ...} shape resolve_team_members expects. Treat it as read-only;
+    call modules.attendees.reload_config() after editing the file.
+    """
+    return {'teams': attendees.TEAMS}
 
 
 def resolve_team_members(team_name, teams_data):
@@ -101,10 +110,9 @@ def resolve_team_members(team_name, teams_data):
 
 def load_api_key():
     """Load Gemini API key from config."""
-    api_key_file = os.path.join(os.path.dirname(__file__), '..', 'config', 'api_key.json')
-    if not os.path.exists(api_key_file):
+    if not os.path.exists(API_KEY_FILE):
         return None
-    with open(api_key_file, 'r') as f:
+    with open(API_KEY_FILE, 'r') as f:
         data = json.load(f)
         return data.get('GEMINI_API_KEY')
 